@@ -16,8 +16,9 @@ from pathlib import Path
 from textwrap import dedent
 
 try:
-    from ollama_summary_generator import OllamaSummaryGenerator
-    OLLAMA_AVAILABLE = True
+    # requests is imported lazily by the generator, so check for it here
+    from ollama_summary_generator import OllamaSummaryGenerator, REQUESTS_AVAILABLE
+    OLLAMA_AVAILABLE = REQUESTS_AVAILABLE
 except ImportError:
     OLLAMA_AVAILABLE = False
 
@@ -153,6 +153,8 @@ def cleanup_after_analysis():
     # Cleanup Ollama generators and unload models
     for generator in _active_ollama_generators:
         try:
+            if hasattr(generator, 'release_gpu'):
+                generator.release_gpu()
             if hasattr(generator, 'cleanup'):
                 generator.cleanup()
         except:
@@ -1555,10 +1557,9 @@ def add_data_lineage(results, text, output_name):
 
 def add_nist_compliance(results, text):
     """Add NIST AI RMF compliance check."""
-    from nist_compliance_checker import NISTComplianceChecker
+    from nist_compliance_checker import DEFAULT_CHECKER
     
-    checker = NISTComplianceChecker()
-    nist_results = checker.check_compliance(results)
+    nist_results = DEFAULT_CHECKER.check_compliance(results)
     
     results['nist_compliance'] = nist_results
     return results
@@ -20,8 +20,132 @@ v8.4.0 Enhancement: Cross-Module Score Dependencies
 - Fixes Bill-C15-12 discrepancy: Trust 53% cannot coexist with NIST 96%
 """
 
-from typing import Dict, List
+import io
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TextIO, Tuple
 from datetime import datetime
+from types import MappingProxyType
+
+
+_HRULE = "=" * 80
+_BOX_LINE = "─" * 78
+_BOX_TOP = "┌" + _BOX_LINE + "┐"
+_BOX_MID = "├" + _BOX_LINE + "┤"
+_BOX_BOTTOM = "└" + _BOX_LINE + "┘"
+
+# v8.4.0: Heading of the dependency adjustments box
+_ADJUSTMENTS_HEADER = (
+    _BOX_TOP + "\n"
+    "│ ⚠️  CROSS-MODULE DEPENDENCY ADJUSTMENTS APPLIED                          │\n"
+    + _BOX_MID + "\n"
+)
+_ADJUSTMENTS_FOOTER = _BOX_BOTTOM + "\n\n"
+_PILLAR_FOOTER = "└" + _BOX_LINE + "\n\n"
+_REPORT_FOOTER = _HRULE + "\n"
+
+# Static report header, built once at import; v8.3.2 scope clarification box
+_BANNER_TEMPLATE = "\n".join([
+    _HRULE,
+    "  NIST AI RISK MANAGEMENT FRAMEWORK (RMF) v1.0 - COMPLIANCE REPORT",
+    _HRULE,
+    "",
+    _BOX_TOP,
+    "│ SCOPE: This report assesses SPARROW SPOT SCALE™ TOOL compliance,        │",
+    "│        NOT the analyzed document's NIST compliance.                     │",
+    "│        This is a self-assessment of the analysis methodology.          │",
+    _BOX_BOTTOM,
+    "",
+    "Assessment Date: {date}",
+    "Overall Compliance Score: {score}/100",
+    "Compliance Level: {level}",
+    "",
+    "",
+])
+
+
+_MISSING = object()
+
+
+class _Rule(NamedTuple):
+    """
+    One pillar requirement.
+    
+    The rule passes when any of ``paths`` resolves in the report (and is
+    truthy, if ``truthy`` is set). ``pass_evidence`` may contain ``{v}``,
+    filled from ``value_path`` (or ``value_default`` when absent).
+    """
+    requirement: str
+    paths: Tuple[Tuple[str, ...], ...]
+    pass_weight: float
+    pass_evidence: str
+    miss_status: str
+    miss_weight: float
+    miss_evidence: str
+    value_path: Tuple[str, ...] = ()
+    value_default: Any = None
+    truthy: bool = False
+
+
+class _PillarResult(NamedTuple):
+    """Evaluated pillar, before expansion into the report dict."""
+    name: str
+    score: float
+    adjustment: Optional[Dict]
+    checks: List[Tuple[str, str, str]]
+    summary: str
+
+
+class _Assessment(NamedTuple):
+    """Outcome of NISTComplianceChecker._assess."""
+    pillars: List[_PillarResult]
+    overall_score: float
+    level: str
+    adjustments: List[Dict]
+
+
+def _dig(d: Any, *keys: str, default: Any = _MISSING) -> Any:
+    """
+    Follow ``keys`` through nested dicts.
+    
+    Returns ``default`` (the _MISSING sentinel unless given) as soon as a
+    key is absent or an intermediate value is not a dict.
+    """
+    for key in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key, _MISSING)
+        if d is _MISSING:
+            return default
+    return d
+
+
+def _compile_rule(rule: _Rule) -> Tuple:
+    """
+    Flatten a rule for _evaluate_pillar.
+    
+    Returns (paths, truthy, pass_weight, pass_check, value_path,
+    value_default, miss_check, miss_weight), where the check entries are
+    ready-made (requirement, status, evidence) tuples. A pass_check whose
+    rule has a value_path still carries the unformatted evidence template.
+    """
+    return (
+        rule.paths,
+        rule.truthy,
+        rule.pass_weight,
+        (rule.requirement, "PASS", rule.pass_evidence),
+        rule.value_path,
+        rule.value_default,
+        (rule.requirement, rule.miss_status, rule.miss_evidence),
+        rule.miss_weight,
+    )
+
+
+def _expand_checks(checks: List[Tuple[str, str, str]]) -> List[Dict]:
+    """Expand internal (requirement, status, evidence) tuples to report dicts."""
+    return [
+        {"requirement": r, "status": s, "evidence": e}
+        for r, s, e in checks
+    ]
 
 
 class NISTComplianceChecker:
@@ -43,12 +167,12 @@ class NISTComplianceChecker:
     - NOT = "The analyzed budget document has governance structures"
     """
     
-    PILLARS = {
+    PILLARS = MappingProxyType({
         "GOVERN": "Governance structures and policies",
         "MAP": "Context understanding and risk identification",
         "MEASURE": "Metrics and assessment methods",
         "MANAGE": "Risk mitigation and monitoring"
-    }
+    })
     
     # v8.4.0: Score dependency thresholds
     TRUST_THRESHOLD_FOR_GOVERN = 70  # If trust < 70, cap GOVERN at 75
@@ -57,13 +181,96 @@ class NISTComplianceChecker:
     MEASURE_CAP_WHEN_LOW_FAIRNESS = 60
     PILLAR_THRESHOLD_FOR_EXCELLENT = 70  # No pillar can be "excellent" if any < 70
     
-    def __init__(self):
-        """Initialize compliance checker."""
-        self.checks = []
-        # v8.4.0: Track dependency adjustments
-        self.dependency_adjustments = []
+    # Compliance level bands: score >= threshold[i] earns label[i + 1]
+    _LEVEL_THRESHOLDS = (40, 60, 75, 90)
+    _LEVEL_LABELS = (
+        "Poor Compliance",
+        "Limited Compliance",
+        "Moderate Compliance",
+        "Good Compliance",
+        "Excellent Compliance"
+    )
+    
+    _STATUS_ICON = MappingProxyType({"PASS": "✅", "FAIL": "❌", "PARTIAL": "⚠️"})
+    
+    # Requirement rules per pillar, evaluated in order (see _COMPILED_SPEC)
+    _PILLAR_SPEC = MappingProxyType({
+        "GOVERN": (
+            _Rule("Trust and accountability metrics", (("trust_score",),),
+                  25, "Trust score: {v}/100", "FAIL", 0, "No trust score found",
+                  value_path=("trust_score", "trust_score"), value_default=0),
+            _Rule("Risk tier classification", (("risk_tier",),),
+                  25, "Risk tier: {v}", "FAIL", 0, "No risk classification found",
+                  value_path=("risk_tier", "risk_tier"), value_default="UNKNOWN"),
+            _Rule("Ethical considerations framework", (("ethical_framework",),),
+                  25, "Ethical framework assessment present", "FAIL", 0, "No ethical framework found"),
+            _Rule("Human oversight trigger", (("ethical_summary", "escalation_required"),),
+                  25, "Escalation to human review when needed", "PARTIAL", 15, "Escalation mechanism present",
+                  truthy=True),
+        ),
+        "MAP": (
+            _Rule("AI content detection", (("ai_detection",), ("deep_analysis",)),
+                  25, "AI detection system active", "FAIL", 0, "No AI detection found"),
+            # Bonus weight for deep analysis
+            _Rule("Deep context analysis", (("deep_analysis",),),
+                  30, "6-level deep analysis performed", "PARTIAL", 10, "Basic analysis only"),
+            _Rule("Bias identification", (("bias_audit",),),
+                  25, "Fairness score: {v}%", "FAIL", 0, "No bias audit found",
+                  value_path=("bias_audit", "overall_fairness_score"), value_default=0),
+            _Rule("Risk context mapping", (("risk_tier",),),
+                  20, "Risk tier: {v}", "FAIL", 0, "No risk mapping found",
+                  value_path=("risk_tier", "risk_tier"), value_default="UNKNOWN"),
+        ),
+        "MEASURE": (
+            _Rule("Quantitative quality metrics", (("composite_score",),),
+                  20, "Composite score: {v}/100", "FAIL", 0, "No scoring system found",
+                  value_path=("composite_score",), value_default=0),
+            _Rule("Statistical validation", (("deep_analysis", "level6_statistics"),),
+                  25, "Statistical metrics calculated", "PARTIAL", 10, "Limited statistical analysis"),
+            _Rule("Transparency measurement", (("deep_analysis", "consensus"),),
+                  30, "Transparency score: {v}/100", "FAIL", 0, "No transparency metrics",
+                  value_path=("deep_analysis", "consensus", "transparency_score"), value_default=0),
+            _Rule("Fairness/bias metrics", (("bias_audit",),),
+                  25, "Bias audit with fairness scores", "FAIL", 0, "No fairness metrics"),
+        ),
+        "MANAGE": (
+            _Rule("Risk mitigation recommendations", (("ethical_summary",),),
+                  25, "Ethical summary with recommendations provided", "FAIL", 0, "No recommendations found"),
+            _Rule("Escalation process", (("ethical_summary", "escalation_required"),),
+                  25, "Automatic escalation triggers configured", "FAIL", 0, "No escalation process"),
+            # Continuous monitoring (adjustment log)
+            _Rule("Continuous improvement", (("bias_audit", "adjustment_log"),),
+                  25, "Post-audit adjustments tracked", "PARTIAL", 10, "Limited adjustment tracking"),
+            _Rule("Documentation and reporting", (("generation_log",), ("narrative_outputs",)),
+                  25, "Comprehensive reporting generated", "PARTIAL", 15, "Basic reporting only"),
+        ),
+    })
+    
+    # _PILLAR_SPEC flattened into plain tuples with the check records
+    # prebuilt, so evaluation unpacks locals instead of reading attributes
+    _COMPILED_SPEC = MappingProxyType({
+        pillar: tuple(_compile_rule(rule) for rule in rules)
+        for pillar, rules in _PILLAR_SPEC.items()
+    })
+    
+    # Every key path referenced by _PILLAR_SPEC plus all of their prefixes,
+    # as (path, parent_path, key) with parents ordered before children, so
+    # each sub-dict is looked up once and absent parents short-circuit
+    _SPEC_PATH_PLAN = tuple(
+        (path, path[:-1] or None, path[-1])
+        for path in sorted(
+            dict.fromkeys(
+                path[:i]
+                for rules in _PILLAR_SPEC.values()
+                for rule in rules
+                for path in (*rule.paths, rule.value_path)
+                for i in range(1, len(path) + 1)
+            ),
+            key=len
+        )
+    )
     
-    def check_compliance(self, report: Dict) -> Dict:
+    def check_compliance(self, report: Dict, now: Optional[datetime] = None) -> Dict:
         """
         Check NIST AI RMF compliance based on v8.2 features.
         
@@ -72,75 +279,112 @@ class NISTComplianceChecker:
         
         Args:
             report: Sparrow grading report JSON
+            now: Assessment timestamp (defaults to the current time)
         
         Returns:
             Compliance assessment dictionary
         """
-        # v8.4.0: Reset dependency adjustments
-        self.dependency_adjustments = []
+        if now is None:
+            now = datetime.now()
+        
+        assessment = self._assess(report)
+        
+        pillars = {}
+        for result in assessment.pillars:
+            pillar = {
+                "pillar": result.name,
+                "description": self.PILLARS[result.name],
+                "score": result.score,
+                "checks": _expand_checks(result.checks),
+                "summary": result.summary
+            }
+            if result.adjustment is not None:
+                pillar["dependency_adjustment"] = result.adjustment
+            pillars[result.name] = pillar
         
-        # v8.4.0: Extract cross-module scores for dependency checks
-        trust_score = report.get("trust_score", {}).get("trust_score", 100)
-        fairness_score = report.get("bias_audit", {}).get("overall_fairness_score", 100)
-        
-        compliance = {
+        return {
             "framework": "NIST AI RMF v1.0",
-            "assessment_date": datetime.now().isoformat(),
-            "pillars": {},
-            "overall_compliance_score": 0.0,
-            "compliance_level": "",
-            # v8.4.0: Track dependency-based adjustments
-            "dependency_adjustments": []
+            "assessment_date": now.isoformat(),
+            "pillars": pillars,
+            "overall_compliance_score": assessment.overall_score,
+            "compliance_level": assessment.level,
+            # v8.4.0: Include all adjustments in output
+            "dependency_adjustments": assessment.adjustments
         }
+    
+    def _assess(self, report: Dict) -> _Assessment:
+        """
+        Evaluate all pillars and dependency rules without building the
+        nested output dicts; shared by check_compliance and the renderer.
+        """
+        # v8.4.0: Track dependency adjustments (per call, so the checker
+        # holds no state and can be shared and returned lists never alias)
+        dependency_adjustments = []
+        add_adjustment = dependency_adjustments.append
         
-        # Check each pillar
-        compliance["pillars"]["GOVERN"] = self._check_govern(report)
-        compliance["pillars"]["MAP"] = self._check_map(report)
-        compliance["pillars"]["MEASURE"] = self._check_measure(report)
-        compliance["pillars"]["MANAGE"] = self._check_manage(report)
+        # v8.4.0: Extract cross-module scores for dependency checks
+        trust_score = _dig(report, "trust_score", "trust_score", default=100)
+        fairness_score = _dig(report, "bias_audit", "overall_fairness_score", default=100)
         
-        # v8.4.0: Apply cross-module dependency rules
+        # v8.4.0: Resolve cross-module dependency caps up front from the two
+        # scalar scores, then apply them as each pillar is evaluated
+        caps = {}
         
         # Rule 1: If trust_score < 70, cap GOVERN at 75
         if trust_score < self.TRUST_THRESHOLD_FOR_GOVERN:
-            original_score = compliance["pillars"]["GOVERN"]["score"]
-            if original_score > self.GOVERN_CAP_WHEN_LOW_TRUST:
-                compliance["pillars"]["GOVERN"]["score"] = self.GOVERN_CAP_WHEN_LOW_TRUST
-                adjustment = {
-                    "pillar": "GOVERN",
-                    "original_score": original_score,
-                    "adjusted_score": self.GOVERN_CAP_WHEN_LOW_TRUST,
-                    "reason": f"Trust score ({trust_score:.1f}) below threshold ({self.TRUST_THRESHOLD_FOR_GOVERN})",
-                    "rule": "TRUST_DEPENDENCY"
-                }
-                self.dependency_adjustments.append(adjustment)
-                compliance["pillars"]["GOVERN"]["dependency_adjustment"] = adjustment
+            caps["GOVERN"] = (
+                self.GOVERN_CAP_WHEN_LOW_TRUST,
+                f"Trust score ({trust_score:.1f}) below threshold ({self.TRUST_THRESHOLD_FOR_GOVERN})",
+                "TRUST_DEPENDENCY"
+            )
         
         # Rule 2: If fairness_score < 40, cap MEASURE at 60
         if fairness_score < self.FAIRNESS_THRESHOLD_FOR_MEASURE:
-            original_score = compliance["pillars"]["MEASURE"]["score"]
-            if original_score > self.MEASURE_CAP_WHEN_LOW_FAIRNESS:
-                compliance["pillars"]["MEASURE"]["score"] = self.MEASURE_CAP_WHEN_LOW_FAIRNESS
+            caps["MEASURE"] = (
+                self.MEASURE_CAP_WHEN_LOW_FAIRNESS,
+                f"Fairness score ({fairness_score:.1f}%) below threshold ({self.FAIRNESS_THRESHOLD_FOR_MEASURE}%)",
+                "FAIRNESS_DEPENDENCY"
+            )
+        
+        # Resolve every key path the rules probe once, shared by all pillars
+        view = {}
+        for path, parent, key in self._SPEC_PATH_PLAN:
+            base = report if parent is None else view[parent]
+            view[path] = base.get(key, _MISSING) if isinstance(base, dict) else _MISSING
+        
+        # Check each pillar, accumulating total and lowest score as we go
+        results = []
+        total = 0.0
+        min_pillar_score = 100.0
+        for pillar_name in self.PILLARS:
+            score, checks, summary = self._evaluate_pillar(view, pillar_name)
+            adjustment = None
+            cap = caps.get(pillar_name)
+            if cap is not None and score > cap[0]:
+                cap_score, reason, rule = cap
                 adjustment = {
-                    "pillar": "MEASURE",
-                    "original_score": original_score,
-                    "adjusted_score": self.MEASURE_CAP_WHEN_LOW_FAIRNESS,
-                    "reason": f"Fairness score ({fairness_score:.1f}%) below threshold ({self.FAIRNESS_THRESHOLD_FOR_MEASURE}%)",
-                    "rule": "FAIRNESS_DEPENDENCY"
+                    "pillar": pillar_name,
+                    "original_score": score,
+                    "adjusted_score": cap_score,
+                    "reason": reason,
+                    "rule": rule
                 }
-                self.dependency_adjustments.append(adjustment)
-                compliance["pillars"]["MEASURE"]["dependency_adjustment"] = adjustment
+                score = cap_score
+                add_adjustment(adjustment)
+            results.append(_PillarResult(pillar_name, score, adjustment, checks, summary))
+            
+            total += score
+            if score < min_pillar_score:
+                min_pillar_score = score
         
         # Calculate overall score (after adjustments)
-        pillar_scores = [p["score"] for p in compliance["pillars"].values()]
-        compliance["overall_compliance_score"] = round(sum(pillar_scores) / len(pillar_scores), 1)
+        overall_score = round(total / len(self.PILLARS), 1)
         
         # v8.4.0: Rule 3: Adjust compliance level if any pillar < 70
-        min_pillar_score = min(pillar_scores)
-        if min_pillar_score < self.PILLAR_THRESHOLD_FOR_EXCELLENT and compliance["overall_compliance_score"] >= 90:
+        if min_pillar_score < self.PILLAR_THRESHOLD_FOR_EXCELLENT and overall_score >= 90:
             # Cannot be "Excellent" if any pillar fails threshold
-            compliance["compliance_level"] = "Good Compliance (Limited by weakest pillar)"
-            self.dependency_adjustments.append({
+            level = "Good Compliance (Limited by weakest pillar)"
+            add_adjustment({
                 "adjustment": "compliance_level",
                 "original": "Excellent Compliance",
                 "adjusted": "Good Compliance (Limited by weakest pillar)",
@@ -148,383 +392,127 @@ class NISTComplianceChecker:
                 "rule": "PILLAR_MINIMUM"
             })
         else:
-            compliance["compliance_level"] = self._get_compliance_level(compliance["overall_compliance_score"])
-        
-        # v8.4.0: Include all adjustments in output
-        compliance["dependency_adjustments"] = self.dependency_adjustments
-        
-        return compliance
-    
-    def _check_govern(self, report: Dict) -> Dict:
-        """Check GOVERN pillar compliance."""
-        checks = []
-        score = 0.0
-        
-        # Check: Trust score calculation
-        if "trust_score" in report:
-            checks.append({
-                "requirement": "Trust and accountability metrics",
-                "status": "PASS",
-                "evidence": f"Trust score: {report['trust_score'].get('trust_score', 0)}/100"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Trust and accountability metrics",
-                "status": "FAIL",
-                "evidence": "No trust score found"
-            })
-        
-        # Check: Risk classification
-        if "risk_tier" in report:
-            checks.append({
-                "requirement": "Risk tier classification",
-                "status": "PASS",
-                "evidence": f"Risk tier: {report['risk_tier'].get('risk_tier', 'UNKNOWN')}"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Risk tier classification",
-                "status": "FAIL",
-                "evidence": "No risk classification found"
-            })
-        
-        # Check: Ethical framework
-        if "ethical_framework" in report:
-            checks.append({
-                "requirement": "Ethical considerations framework",
-                "status": "PASS",
-                "evidence": "Ethical framework assessment present"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Ethical considerations framework",
-                "status": "FAIL",
-                "evidence": "No ethical framework found"
-            })
-        
-        # Check: Human oversight
-        if "ethical_summary" in report and report["ethical_summary"].get("escalation_required"):
-            checks.append({
-                "requirement": "Human oversight trigger",
-                "status": "PASS",
-                "evidence": "Escalation to human review when needed"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Human oversight trigger",
-                "status": "PARTIAL",
-                "evidence": "Escalation mechanism present"
-            })
-            score += 15
-        
-        return {
-            "pillar": "GOVERN",
-            "description": self.PILLARS["GOVERN"],
-            "score": min(score, 100),
-            "checks": checks,
-            "summary": f"{len([c for c in checks if c['status'] == 'PASS'])}/{len(checks)} requirements met"
-        }
-    
-    def _check_map(self, report: Dict) -> Dict:
-        """Check MAP pillar compliance."""
-        checks = []
-        score = 0.0
-        
-        # Check: AI detection
-        if "ai_detection" in report or "deep_analysis" in report:
-            checks.append({
-                "requirement": "AI content detection",
-                "status": "PASS",
-                "evidence": "AI detection system active"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "AI content detection",
-                "status": "FAIL",
-                "evidence": "No AI detection found"
-            })
-        
-        # Check: Deep analysis (context understanding)
-        if "deep_analysis" in report:
-            checks.append({
-                "requirement": "Deep context analysis",
-                "status": "PASS",
-                "evidence": "6-level deep analysis performed"
-            })
-            score += 30  # Bonus for deep analysis
-        else:
-            checks.append({
-                "requirement": "Deep context analysis",
-                "status": "PARTIAL",
-                "evidence": "Basic analysis only"
-            })
-            score += 10
-        
-        # Check: Bias identification
-        if "bias_audit" in report:
-            checks.append({
-                "requirement": "Bias identification",
-                "status": "PASS",
-                "evidence": f"Fairness score: {report['bias_audit'].get('overall_fairness_score', 0)}%"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Bias identification",
-                "status": "FAIL",
-                "evidence": "No bias audit found"
-            })
+            level = self._get_compliance_level(overall_score)
         
-        # Check: Risk mapping
-        if "risk_tier" in report:
-            checks.append({
-                "requirement": "Risk context mapping",
-                "status": "PASS",
-                "evidence": f"Risk tier: {report['risk_tier'].get('risk_tier', 'UNKNOWN')}"
-            })
-            score += 20
-        else:
-            checks.append({
-                "requirement": "Risk context mapping",
-                "status": "FAIL",
-                "evidence": "No risk mapping found"
-            })
-        
-        return {
-            "pillar": "MAP",
-            "description": self.PILLARS["MAP"],
-            "score": min(score, 100),
-            "checks": checks,
-            "summary": f"{len([c for c in checks if c['status'] == 'PASS'])}/{len(checks)} requirements met"
-        }
+        return _Assessment(results, overall_score, level, dependency_adjustments)
     
-    def _check_measure(self, report: Dict) -> Dict:
-        """Check MEASURE pillar compliance."""
-        checks = []
-        score = 0.0
-        
-        # Check: Quantitative metrics
-        if "composite_score" in report:
-            checks.append({
-                "requirement": "Quantitative quality metrics",
-                "status": "PASS",
-                "evidence": f"Composite score: {report.get('composite_score', 0)}/100"
-            })
-            score += 20
-        else:
-            checks.append({
-                "requirement": "Quantitative quality metrics",
-                "status": "FAIL",
-                "evidence": "No scoring system found"
-            })
-        
-        # Check: Statistical analysis
-        if "deep_analysis" in report and "level6_statistics" in report["deep_analysis"]:
-            checks.append({
-                "requirement": "Statistical validation",
-                "status": "PASS",
-                "evidence": "Statistical metrics calculated"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Statistical validation",
-                "status": "PARTIAL",
-                "evidence": "Limited statistical analysis"
-            })
-            score += 10
-        
-        # Check: Transparency scoring
-        if "deep_analysis" in report and "consensus" in report["deep_analysis"]:
-            transparency = report["deep_analysis"]["consensus"].get("transparency_score", 0)
-            checks.append({
-                "requirement": "Transparency measurement",
-                "status": "PASS",
-                "evidence": f"Transparency score: {transparency}/100"
-            })
-            score += 30
-        else:
-            checks.append({
-                "requirement": "Transparency measurement",
-                "status": "FAIL",
-                "evidence": "No transparency metrics"
-            })
+    def _evaluate_pillar(self, view: Dict[Tuple[str, ...], Any],
+                         pillar_name: str) -> Tuple[float, List[Tuple[str, str, str]], str]:
+        """
+        Evaluate one pillar against its compiled rules.
         
-        # Check: Fairness metrics
-        if "bias_audit" in report:
-            checks.append({
-                "requirement": "Fairness/bias metrics",
-                "status": "PASS",
-                "evidence": "Bias audit with fairness scores"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Fairness/bias metrics",
-                "status": "FAIL",
-                "evidence": "No fairness metrics"
-            })
+        Args:
+            view: Report values keyed by every path in _SPEC_PATH_PLAN
+            pillar_name: Key into _PILLAR_SPEC
         
-        return {
-            "pillar": "MEASURE",
-            "description": self.PILLARS["MEASURE"],
-            "score": min(score, 100),
-            "checks": checks,
-            "summary": f"{len([c for c in checks if c['status'] == 'PASS'])}/{len(checks)} requirements met"
-        }
-    
-    def _check_manage(self, report: Dict) -> Dict:
-        """Check MANAGE pillar compliance."""
+        Returns:
+            (score, check tuples, summary)
+        """
         checks = []
         score = 0.0
+        pass_count = 0
+        
+        for (paths, truthy, pass_weight, pass_check, value_path, value_default,
+             miss_check, miss_weight) in self._COMPILED_SPEC[pillar_name]:
+            present = False
+            for path in paths:
+                value = view[path]
+                if value is not _MISSING and (value or not truthy):
+                    present = True
+                    break
+            
+            if present:
+                if value_path:
+                    value = view[value_path]
+                    if value is _MISSING:
+                        value = value_default
+                    pass_check = (pass_check[0], "PASS", pass_check[2].format(v=value))
+                checks.append(pass_check)
+                score += pass_weight
+                pass_count += 1
+            else:
+                checks.append(miss_check)
+                score += miss_weight
         
-        # Check: Risk mitigation recommendations
-        if "ethical_summary" in report:
-            checks.append({
-                "requirement": "Risk mitigation recommendations",
-                "status": "PASS",
-                "evidence": "Ethical summary with recommendations provided"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Risk mitigation recommendations",
-                "status": "FAIL",
-                "evidence": "No recommendations found"
-            })
-        
-        # Check: Escalation process
-        if "ethical_summary" in report and "escalation_required" in report["ethical_summary"]:
-            checks.append({
-                "requirement": "Escalation process",
-                "status": "PASS",
-                "evidence": "Automatic escalation triggers configured"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Escalation process",
-                "status": "FAIL",
-                "evidence": "No escalation process"
-            })
-        
-        # Check: Continuous monitoring (adjustment log)
-        if "bias_audit" in report and "adjustment_log" in report["bias_audit"]:
-            checks.append({
-                "requirement": "Continuous improvement",
-                "status": "PASS",
-                "evidence": "Post-audit adjustments tracked"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Continuous improvement",
-                "status": "PARTIAL",
-                "evidence": "Limited adjustment tracking"
-            })
-            score += 10
-        
-        # Check: Documentation/reporting
-        if "generation_log" in report or "narrative_outputs" in report:
-            checks.append({
-                "requirement": "Documentation and reporting",
-                "status": "PASS",
-                "evidence": "Comprehensive reporting generated"
-            })
-            score += 25
-        else:
-            checks.append({
-                "requirement": "Documentation and reporting",
-                "status": "PARTIAL",
-                "evidence": "Basic reporting only"
-            })
-            score += 15
-        
-        return {
-            "pillar": "MANAGE",
-            "description": self.PILLARS["MANAGE"],
-            "score": min(score, 100),
-            "checks": checks,
-            "summary": f"{len([c for c in checks if c['status'] == 'PASS'])}/{len(checks)} requirements met"
-        }
+        return score, checks, f"{pass_count}/{len(checks)} requirements met"
     
     def _get_compliance_level(self, score: float) -> str:
         """Get compliance level from score."""
-        if score >= 90:
-            return "Excellent Compliance"
-        elif score >= 75:
-            return "Good Compliance"
-        elif score >= 60:
-            return "Moderate Compliance"
-        elif score >= 40:
-            return "Limited Compliance"
-        else:
-            return "Poor Compliance"
+        return self._LEVEL_LABELS[bisect_right(self._LEVEL_THRESHOLDS, score)]
     
     def generate_compliance_report(self, report: Dict) -> str:
         """Generate formatted NIST AI RMF compliance report."""
-        compliance = self.check_compliance(report)
+        buf = io.StringIO()
+        self.write_compliance_report(report, buf)
+        return buf.getvalue().rstrip("\n")
+    
+    def write_compliance_report(self, report: Dict, sink: TextIO) -> None:
+        """
+        Write formatted NIST AI RMF compliance report to a file-like sink.
+        
+        Lines are written as they are produced, so long reports can be
+        streamed straight to a file or response without building the
+        whole text in memory.
         
-        lines = []
-        lines.append("=" * 80)
-        lines.append("  NIST AI RISK MANAGEMENT FRAMEWORK (RMF) v1.0 - COMPLIANCE REPORT")
-        lines.append("=" * 80)
-        lines.append("")
-        # v8.3.2: Add scope clarification
-        lines.append("┌" + "─" * 78 + "┐")
-        lines.append("│ SCOPE: This report assesses SPARROW SPOT SCALE™ TOOL compliance,        │")
-        lines.append("│        NOT the analyzed document's NIST compliance.                     │")
-        lines.append("│        This is a self-assessment of the analysis methodology.          │")
-        lines.append("└" + "─" * 78 + "┘")
-        lines.append("")
-        lines.append(f"Assessment Date: {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}")
-        lines.append(f"Overall Compliance Score: {compliance['overall_compliance_score']}/100")
-        lines.append(f"Compliance Level: {compliance['compliance_level']}")
-        lines.append("")
+        Args:
+            report: Sparrow grading report JSON
+            sink: Any object with a ``write(str)`` method
+        """
+        # Render straight from the assessment; the check_compliance dict
+        # is not needed for text output
+        self._emit(self._assess(report), sink.write, datetime.now())
+    
+    def _emit(self, assessment: _Assessment, w: Callable[[str], object], now: datetime) -> None:
+        """Emit report lines for an assessment through ``w``."""
+        w(_BANNER_TEMPLATE.format(
+            date=now.strftime('%B %d, %Y at %H:%M:%S'),
+            score=assessment.overall_score,
+            level=assessment.level,
+        ))
         
         # v8.4.0: Show dependency adjustments if any
-        if compliance.get("dependency_adjustments"):
-            lines.append("┌" + "─" * 78 + "┐")
-            lines.append("│ ⚠️  CROSS-MODULE DEPENDENCY ADJUSTMENTS APPLIED                          │")
-            lines.append("├" + "─" * 78 + "┤")
-            for adj in compliance["dependency_adjustments"]:
+        if assessment.adjustments:
+            w(_ADJUSTMENTS_HEADER)
+            for adj in assessment.adjustments:
                 if "pillar" in adj:
-                    lines.append(f"│ • {adj['pillar']}: {adj['original_score']:.0f} → {adj['adjusted_score']:.0f}")
-                    lines.append(f"│   Reason: {adj['reason']}")
+                    w(f"│ • {adj['pillar']}: {adj['original_score']:.0f} → {adj['adjusted_score']:.0f}\n")
+                    w(f"│   Reason: {adj['reason']}\n")
                 else:
-                    lines.append(f"│ • {adj['adjustment']}: {adj['original']} → {adj['adjusted']}")
-                    lines.append(f"│   Reason: {adj['reason']}")
-            lines.append("└" + "─" * 78 + "┘")
-            lines.append("")
+                    w(f"│ • {adj['adjustment']}: {adj['original']} → {adj['adjusted']}\n")
+                    w(f"│   Reason: {adj['reason']}\n")
+            w(_ADJUSTMENTS_FOOTER)
         
-        for pillar_name, pillar_data in compliance["pillars"].items():
-            lines.append(f"┌─ {pillar_name} PILLAR: {pillar_data['description']}")
+        for pillar in assessment.pillars:
+            w(f"┌─ {pillar.name} PILLAR: {self.PILLARS[pillar.name]}\n")
             # v8.4.0: Show if score was adjusted
-            if "dependency_adjustment" in pillar_data:
-                adj = pillar_data["dependency_adjustment"]
-                lines.append(f"│  Score: {pillar_data['score']}/100 (adjusted from {adj['original_score']:.0f})")
-                lines.append(f"│  ⚠️ {adj['reason']}")
+            adj = pillar.adjustment
+            if adj is not None:
+                w(f"│  Score: {pillar.score}/100 (adjusted from {adj['original_score']:.0f})\n")
+                w(f"│  ⚠️ {adj['reason']}\n")
             else:
-                lines.append(f"│  Score: {pillar_data['score']}/100")
-            lines.append(f"│  Summary: {pillar_data['summary']}")
-            lines.append("│")
+                w(f"│  Score: {pillar.score}/100\n")
+            w(f"│  Summary: {pillar.summary}\n")
+            w("│\n")
             
-            for check in pillar_data["checks"]:
-                status_icon = {"PASS": "✅", "FAIL": "❌", "PARTIAL": "⚠️"}.get(check["status"], "")
-                lines.append(f"│  {status_icon} {check['requirement']}")
-                lines.append(f"│     → {check['evidence']}")
+            for requirement, status, evidence in pillar.checks:
+                status_icon = self._STATUS_ICON.get(status, "")
+                w(f"│  {status_icon} {requirement}\n")
+                w(f"│     → {evidence}\n")
             
-            lines.append("└" + "─" * 78)
-            lines.append("")
-        
-        lines.append("=" * 80)
+            w(_PILLAR_FOOTER)
         
-        return "\n".join(lines)
+        w(_REPORT_FOOTER)
+
+
+# Pillar scores are not clamped at evaluation time, so the rule weights must
+# never allow a pillar to exceed 100
+for _pillar, _rules in NISTComplianceChecker._PILLAR_SPEC.items():
+    if sum(max(rule.pass_weight, rule.miss_weight) for rule in _rules) > 100:
+        raise ValueError(f"NIST {_pillar} rule weights can exceed 100")
+
+
+# Shared stateless instance; callers need not construct their own checker
+DEFAULT_CHECKER = NISTComplianceChecker()
 
 
 if __name__ == "__main__":
@@ -10,9 +10,11 @@ Author: SPOT-Policy™ v7.0 Ethical Framework
 Date: November 13, 2025
 """
 
-from typing import Dict, List, Tuple
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
 
 
 class RiskTier(Enum):
@@ -22,21 +24,168 @@ class RiskTier(Enum):
     HIGH = "high"
 
 
+def _function(name: str, *actions: str) -> MappingProxyType:
+    """Frozen NIST function entry (name, status, actions)."""
+    return MappingProxyType({"name": name, "status": "activated", "actions": actions})
+
+
+# Risk score factor tables. Categorical factors score 0 when unrecognised,
+# except document type which has a floor of 5.
+_DOC_TYPE_SCORES = {  # 0-25
+    "budget": 25, "financial_policy": 25, "regulation": 25, "legislation": 25,
+    "strategy": 20, "framework": 20, "plan": 20,
+    "memo": 10, "brief": 10, "analysis": 10,
+}
+_SCOPE_SCORES = {"national": 25, "regional": 15, "departmental": 10, "local": 5}  # 0-25
+_CRITICALITY_SCORES = {"strategic": 20, "operational": 10, "informational": 5}  # 0-20
+_TIMELINE_SCORES = {"immediate": 5, "medium_term": 3, "long_term": 1}  # 0-5
+
+# Numeric bands: a value strictly above thresholds[i] earns scores[i + 1]
+_POPULATION_THRESHOLDS = (1000, 10000, 100000, 1000000)
+_POPULATION_SCORES = (0, 4, 8, 12, 15)  # 0-15
+_BUDGET_THRESHOLDS = (0, 10, 100, 1000)  # $M; top band is > $1B
+_BUDGET_SCORES = (0, 2, 5, 8, 10)  # 0-10
+
+# Controls enforced per tier (immutable; copied out per classification)
+_CONTROLS_BY_TIER: Mapping[RiskTier, Tuple[str, ...]] = MappingProxyType({
+    RiskTier.LOW: (
+        "basic_logging",
+        "version_control",
+        "optional_explainability",
+    ),
+    RiskTier.MEDIUM: (
+        "comprehensive_logging",
+        "bias_audit_basic",
+        "explainability_lime",
+        "error_tracking",
+        "performance_monitoring",
+        "stakeholder_notification",
+    ),
+    RiskTier.HIGH: (
+        "comprehensive_logging",
+        "bias_audit_comprehensive",
+        "explainability_shap_mandatory",
+        "error_tracking_detailed",
+        "performance_monitoring_intensive",
+        "stakeholder_notification_mandatory",
+        "human_review_mandatory",
+        "audit_trail_detailed",
+        "trust_score_calculation",
+        "adversarial_testing",
+        "impact_assessment",
+        "remediation_planning",
+    ),
+})
+
+# Set views for ControlActivationManager membership checks (immutable, so shared)
+_CONTROL_SETS_BY_TIER: Mapping[RiskTier, FrozenSet[str]] = MappingProxyType({
+    tier: frozenset(controls) for tier, controls in _CONTROLS_BY_TIER.items()
+})
+_EXPLAINABILITY_CONTROLS = frozenset({"explainability_shap_mandatory", "explainability_lime"})
+_BIAS_AUDIT_CONTROLS = frozenset({"bias_audit_comprehensive", "bias_audit_basic"})
+_AUDIT_TRAIL_CONTROLS = frozenset({"audit_trail_detailed", "comprehensive_logging"})
+
+# NIST AI RMF functions activated per tier
+_NIST_FUNCTIONS_BY_TIER: Mapping[RiskTier, Tuple[Mapping, ...]] = MappingProxyType({
+    RiskTier.LOW: (
+        _function("Govern",
+                  "Document AI use case"),
+        _function("Map",
+                  "Identify input/output characteristics"),
+    ),
+    RiskTier.MEDIUM: (
+        _function("Govern",
+                  "Document AI use case",
+                  "Define AI governance roles",
+                  "Establish escalation procedures"),
+        _function("Map",
+                  "Identify input/output characteristics",
+                  "Map risk categories",
+                  "Document AI system assumptions"),
+        _function("Measure",
+                  "Measure performance metrics",
+                  "Assess bias levels",
+                  "Calculate fairness ratios"),
+    ),
+    RiskTier.HIGH: (
+        _function("Govern",
+                  "Document AI use case",
+                  "Define AI governance roles",
+                  "Establish escalation procedures",
+                  "Develop impact mitigation strategy",
+                  "Plan stakeholder engagement"),
+        _function("Map",
+                  "Identify input/output characteristics",
+                  "Map risk categories comprehensively",
+                  "Document AI system assumptions",
+                  "Assess external dependencies",
+                  "Evaluate regulatory context"),
+        _function("Measure",
+                  "Measure performance metrics comprehensively",
+                  "Assess bias levels (DIR, EOD, SPD)",
+                  "Calculate fairness ratios",
+                  "Perform adversarial testing",
+                  "Generate explainability metrics",
+                  "Monitor for drift"),
+        _function("Manage",
+                  "Develop risk mitigation plans",
+                  "Implement control measures",
+                  "Plan for human oversight",
+                  "Establish incident response",
+                  "Schedule regular audits",
+                  "Document all decisions"),
+    ),
+})
+
+# Fixed interpretation + recommendation tail of each tier's explanation
+_INTERPRETATION_BY_TIER: Mapping[RiskTier, str] = MappingProxyType({
+    RiskTier.LOW: (
+        "\nInterpretation:\n"
+        "This evaluation task has LOW impact. Standard AI governance applies.\n"
+        "Basic logging and version control are required.\n"
+        "Explainability is optional.\n"
+        "\nRecommendation:\n"
+        "✓ Proceed with standard analysis process."
+    ),
+    RiskTier.MEDIUM: (
+        "\nInterpretation:\n"
+        "This evaluation task has MEDIUM impact. Enhanced AI governance applies.\n"
+        "Bias auditing, basic explainability, and stakeholder notification required.\n"
+        "Human review is recommended for final decisions.\n"
+        "\nRecommendation:\n"
+        "⚠ Proceed with analysis. Plan for qualified review of results."
+    ),
+    RiskTier.HIGH: (
+        "\nInterpretation:\n"
+        "This evaluation task has HIGH impact. COMPREHENSIVE AI governance applies.\n"
+        "NIST AI RMF 1.0 fully activated: Govern, Map, Measure, Manage.\n"
+        "Mandatory: Bias audit, SHAP explainability, human review, audit trail.\n"
+        "This analysis MUST be reviewed by a human expert before use.\n"
+        "\nRecommendation:\n"
+        "⚠ Proceed with analysis AND mandatory professional review."
+    ),
+})
+
+
 class NISTRiskMapper:
     """
     Maps policy evaluation tasks to risk tiers and activates controls.
     Based on NIST AI RMF 1.0 (Govern, Map, Measure, Manage)
     """
     
-    def __init__(self):
-        self.version = "1.0"
-        self.framework = "NIST AI RMF 1.0"
-        self.functions = ["Govern", "Map", "Measure", "Manage"]
+    __slots__ = ()
+    
+    version = "1.0"
+    framework = "NIST AI RMF 1.0"
+    functions = ("Govern", "Map", "Measure", "Manage")
     
-    def classify(self, document_characteristics: Dict) -> Dict:
+    def classify(self, document_characteristics: Dict, now: Optional[datetime] = None) -> Dict:
         """
         Classify evaluation task by risk tier.
         
+        Pass the same ``now`` when classifying a batch to share one timestamp;
+        it defaults to the current UTC time.
+        
         Input:
         {
             "task": "policy_scoring",
@@ -71,6 +220,9 @@ class NISTRiskMapper:
         
         explanation = self._generate_explanation(risk_tier, risk_score, document_characteristics)
         
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
         return {
             "risk_tier": risk_tier.value,
             "risk_score": round(risk_score, 1),
@@ -79,7 +231,7 @@ class NISTRiskMapper:
             "explanation": explanation,
             "framework": self.framework,
             "version": self.version,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": now.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         }
     
     def _calculate_risk_score(self, characteristics: Dict) -> float:
@@ -96,68 +248,12 @@ class NISTRiskMapper:
         """
         
         score = 0.0
-        
-        # Document type score (0-25)
-        document_type = characteristics.get("document_type", "").lower()
-        if document_type in ["budget", "financial_policy", "regulation", "legislation"]:
-            score += 25
-        elif document_type in ["strategy", "framework", "plan"]:
-            score += 20
-        elif document_type in ["memo", "brief", "analysis"]:
-            score += 10
-        else:
-            score += 5
-        
-        # Scope score (0-25)
-        scope = characteristics.get("scope", "").lower()
-        if scope == "national":
-            score += 25
-        elif scope == "regional":
-            score += 15
-        elif scope == "departmental":
-            score += 10
-        elif scope == "local":
-            score += 5
-        
-        # Decision criticality score (0-20)
-        criticality = characteristics.get("decision_criticality", "").lower()
-        if criticality == "strategic":
-            score += 20
-        elif criticality == "operational":
-            score += 10
-        elif criticality == "informational":
-            score += 5
-        
-        # Affected population score (0-15)
-        population = characteristics.get("affected_population", 0)
-        if population > 1000000:
-            score += 15
-        elif population > 100000:
-            score += 12
-        elif population > 10000:
-            score += 8
-        elif population > 1000:
-            score += 4
-        
-        # Budget impact score (0-10)
-        budget_impact = characteristics.get("budget_impact", 0)
-        if budget_impact > 1000:  # > $1B
-            score += 10
-        elif budget_impact > 100:  # > $100M
-            score += 8
-        elif budget_impact > 10:  # > $10M
-            score += 5
-        elif budget_impact > 0:
-            score += 2
-        
-        # Timeline score (0-5)
-        timeline = characteristics.get("timeline", "").lower()
-        if timeline == "immediate":
-            score += 5
-        elif timeline == "medium_term":
-            score += 3
-        elif timeline == "long_term":
-            score += 1
+        score += _DOC_TYPE_SCORES.get(characteristics.get("document_type", "").lower(), 5)
+        score += _SCOPE_SCORES.get(characteristics.get("scope", "").lower(), 0)
+        score += _CRITICALITY_SCORES.get(characteristics.get("decision_criticality", "").lower(), 0)
+        score += _POPULATION_SCORES[bisect_left(_POPULATION_THRESHOLDS, characteristics.get("affected_population", 0))]
+        score += _BUDGET_SCORES[bisect_left(_BUDGET_THRESHOLDS, characteristics.get("budget_impact", 0))]
+        score += _TIMELINE_SCORES.get(characteristics.get("timeline", "").lower(), 0)
         
         return min(score, 100.0)
     
@@ -180,39 +276,7 @@ class NISTRiskMapper:
         Activate controls based on risk tier.
         Controls enforce governance requirements.
         """
-        
-        if risk_tier == RiskTier.LOW:
-            return [
-                "basic_logging",
-                "version_control",
-                "optional_explainability"
-            ]
-        
-        elif risk_tier == RiskTier.MEDIUM:
-            return [
-                "comprehensive_logging",
-                "bias_audit_basic",
-                "explainability_lime",
-                "error_tracking",
-                "performance_monitoring",
-                "stakeholder_notification"
-            ]
-        
-        else:  # HIGH
-            return [
-                "comprehensive_logging",
-                "bias_audit_comprehensive",
-                "explainability_shap_mandatory",
-                "error_tracking_detailed",
-                "performance_monitoring_intensive",
-                "stakeholder_notification_mandatory",
-                "human_review_mandatory",
-                "audit_trail_detailed",
-                "trust_score_calculation",
-                "adversarial_testing",
-                "impact_assessment",
-                "remediation_planning"
-            ]
+        return list(_CONTROLS_BY_TIER[risk_tier])
     
     def _activate_nist_functions(self, risk_tier: RiskTier) -> List[Dict]:
         """
@@ -224,161 +288,37 @@ class NISTRiskMapper:
         3. Measure - Assess AI system performance
         4. Manage - Mitigate identified risks
         """
-        
-        if risk_tier == RiskTier.LOW:
-            return [
-                {
-                    "name": "Govern",
-                    "status": "activated",
-                    "actions": [
-                        "Document AI use case"
-                    ]
-                },
-                {
-                    "name": "Map",
-                    "status": "activated",
-                    "actions": [
-                        "Identify input/output characteristics"
-                    ]
-                }
-            ]
-        
-        elif risk_tier == RiskTier.MEDIUM:
-            return [
-                {
-                    "name": "Govern",
-                    "status": "activated",
-                    "actions": [
-                        "Document AI use case",
-                        "Define AI governance roles",
-                        "Establish escalation procedures"
-                    ]
-                },
-                {
-                    "name": "Map",
-                    "status": "activated",
-                    "actions": [
-                        "Identify input/output characteristics",
-                        "Map risk categories",
-                        "Document AI system assumptions"
-                    ]
-                },
-                {
-                    "name": "Measure",
-                    "status": "activated",
-                    "actions": [
-                        "Measure performance metrics",
-                        "Assess bias levels",
-                        "Calculate fairness ratios"
-                    ]
-                }
-            ]
-        
-        else:  # HIGH
-            return [
-                {
-                    "name": "Govern",
-                    "status": "activated",
-                    "actions": [
-                        "Document AI use case",
-                        "Define AI governance roles",
-                        "Establish escalation procedures",
-                        "Develop impact mitigation strategy",
-                        "Plan stakeholder engagement"
-                    ]
-                },
-                {
-                    "name": "Map",
-                    "status": "activated",
-                    "actions": [
-                        "Identify input/output characteristics",
-                        "Map risk categories comprehensively",
-                        "Document AI system assumptions",
-                        "Assess external dependencies",
-                        "Evaluate regulatory context"
-                    ]
-                },
-                {
-                    "name": "Measure",
-                    "status": "activated",
-                    "actions": [
-                        "Measure performance metrics comprehensively",
-                        "Assess bias levels (DIR, EOD, SPD)",
-                        "Calculate fairness ratios",
-                        "Perform adversarial testing",
-                        "Generate explainability metrics",
-                        "Monitor for drift"
-                    ]
-                },
-                {
-                    "name": "Manage",
-                    "status": "activated",
-                    "actions": [
-                        "Develop risk mitigation plans",
-                        "Implement control measures",
-                        "Plan for human oversight",
-                        "Establish incident response",
-                        "Schedule regular audits",
-                        "Document all decisions"
-                    ]
-                }
-            ]
+        # Fresh plain dicts: the result is JSON-serialized and owned by the caller
+        return [
+            {"name": fn["name"], "status": fn["status"], "actions": list(fn["actions"])}
+            for fn in _NIST_FUNCTIONS_BY_TIER[risk_tier]
+        ]
     
     def _generate_explanation(self, risk_tier: RiskTier, risk_score: float, 
                              characteristics: Dict) -> str:
         """Generate human-readable explanation of classification."""
         
-        explanation = f"Risk Classification: {risk_tier.value.upper()} (Score: {risk_score}/100)\n\n"
-        
-        # Add risk drivers
-        explanation += "Risk Drivers:\n"
-        
-        doc_type = characteristics.get("document_type", "Unknown")
-        explanation += f"• Document Type: {doc_type}\n"
-        
-        scope = characteristics.get("scope", "Unknown")
-        explanation += f"• Scope: {scope}\n"
-        
-        criticality = characteristics.get("decision_criticality", "Unknown")
-        explanation += f"• Decision Criticality: {criticality}\n"
+        parts = [
+            f"Risk Classification: {risk_tier.value.upper()} (Score: {risk_score}/100)\n\n",
+            # Add risk drivers
+            "Risk Drivers:\n",
+            f"• Document Type: {characteristics.get('document_type', 'Unknown')}\n",
+            f"• Scope: {characteristics.get('scope', 'Unknown')}\n",
+            f"• Decision Criticality: {characteristics.get('decision_criticality', 'Unknown')}\n",
+        ]
         
         affected = characteristics.get("affected_population", 0)
         if affected > 0:
-            explanation += f"• Estimated Affected Population: {affected:,}\n"
+            parts.append(f"• Estimated Affected Population: {affected:,}\n")
         
         budget = characteristics.get("budget_impact", 0)
         if budget > 0:
-            explanation += f"• Budget Impact: ${budget}M\n"
+            parts.append(f"• Budget Impact: ${budget}M\n")
         
-        # Add interpretation
-        if risk_tier == RiskTier.LOW:
-            explanation += "\nInterpretation:\n"
-            explanation += "This evaluation task has LOW impact. Standard AI governance applies.\n"
-            explanation += "Basic logging and version control are required.\n"
-            explanation += "Explainability is optional.\n"
+        # Add interpretation and recommendation
+        parts.append(_INTERPRETATION_BY_TIER[risk_tier])
         
-        elif risk_tier == RiskTier.MEDIUM:
-            explanation += "\nInterpretation:\n"
-            explanation += "This evaluation task has MEDIUM impact. Enhanced AI governance applies.\n"
-            explanation += "Bias auditing, basic explainability, and stakeholder notification required.\n"
-            explanation += "Human review is recommended for final decisions.\n"
-        
-        else:  # HIGH
-            explanation += "\nInterpretation:\n"
-            explanation += "This evaluation task has HIGH impact. COMPREHENSIVE AI governance applies.\n"
-            explanation += "NIST AI RMF 1.0 fully activated: Govern, Map, Measure, Manage.\n"
-            explanation += "Mandatory: Bias audit, SHAP explainability, human review, audit trail.\n"
-            explanation += "This analysis MUST be reviewed by a human expert before use.\n"
-        
-        explanation += "\nRecommendation:\n"
-        if risk_tier == RiskTier.LOW:
-            explanation += "✓ Proceed with standard analysis process."
-        elif risk_tier == RiskTier.MEDIUM:
-            explanation += "⚠ Proceed with analysis. Plan for qualified review of results."
-        else:  # HIGH
-            explanation += "⚠ Proceed with analysis AND mandatory professional review."
-        
-        return explanation
+        return "".join(parts)
 
 
 class ControlActivationManager:
@@ -386,51 +326,39 @@ class ControlActivationManager:
     Manages activation and execution of controls based on risk tier.
     """
     
+    __slots__ = ("risk_tier", "controls")
+    
     def __init__(self, risk_tier: str):
         self.risk_tier = risk_tier
         self.controls = self._get_controls_for_tier(risk_tier)
     
-    def _get_controls_for_tier(self, tier: str) -> Dict[str, bool]:
-        """Return activated controls for this risk tier."""
-        mapper = NISTRiskMapper()
-        characteristics = {
-            "task": "policy_scoring",
-            "document_type": "budget",
-            "scope": "national" if tier == "high" else "departmental" if tier == "medium" else "local",
-            "decision_criticality": "strategic" if tier == "high" else "operational" if tier == "medium" else "informational"
-        }
-        
-        result = mapper.classify(characteristics)
-        
-        # Convert to dict of control: active
-        controls = {}
-        for control in result["required_controls"]:
-            controls[control] = True
-        
-        return controls
+    def _get_controls_for_tier(self, tier: str) -> FrozenSet[str]:
+        """Return activated controls for this risk tier (unknown tiers get MEDIUM)."""
+        try:
+            risk_tier = RiskTier(tier)
+        except ValueError:
+            risk_tier = RiskTier.MEDIUM
+        return _CONTROL_SETS_BY_TIER[risk_tier]
     
     def is_control_active(self, control_name: str) -> bool:
         """Check if a specific control is active."""
-        return self.controls.get(control_name, False)
+        return control_name in self.controls
     
     def require_explainability(self) -> bool:
         """Is explainability required?"""
-        return self.is_control_active("explainability_shap_mandatory") or \
-               self.is_control_active("explainability_lime")
+        return not self.controls.isdisjoint(_EXPLAINABILITY_CONTROLS)
     
     def require_bias_audit(self) -> bool:
         """Is bias audit required?"""
-        return self.is_control_active("bias_audit_comprehensive") or \
-               self.is_control_active("bias_audit_basic")
+        return not self.controls.isdisjoint(_BIAS_AUDIT_CONTROLS)
     
     def require_human_review(self) -> bool:
         """Is human review mandatory?"""
-        return self.is_control_active("human_review_mandatory")
+        return "human_review_mandatory" in self.controls
     
     def require_audit_trail(self) -> bool:
         """Is detailed audit trail required?"""
-        return self.is_control_active("audit_trail_detailed") or \
-               self.is_control_active("comprehensive_logging")
+        return not self.controls.isdisjoint(_AUDIT_TRAIL_CONTROLS)
 
 
 # Example usage
@@ -10,16 +10,60 @@ v8.4.0 Enhancements:
 - INCONCLUSIVE detection awareness in AI Transparency sections
 - Standardized narrative voice guidelines across document types
 - Consistent messaging when detection spread >50%
+
+Batch generation (generate_summaries_batch / generate_summaries_async) only
+overlaps requests client-side; start the server with OLLAMA_NUM_PARALLEL set
+(e.g. OLLAMA_NUM_PARALLEL=8) so Ollama actually runs them concurrently.
+Set OLLAMA_MAX_LOADED_MODELS=2 as well so the primary and fallback models can
+stay loaded together instead of evicting each other on fallback.
 """
 
+import glob
+import hashlib
+import importlib.util
 import json
-import requests
-from typing import Optional, Dict, Any, List
+import os
+import statistics
+import sys
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime
 import time
 
+# Optional: faster JSON parsing for large SPOT reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Accepts str or bytes either way; orjson errors subclass ValueError
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 VERSION = "8.4.1"
 
+# requests (and urllib3/ssl behind it) is imported on first use, so importing
+# this module - e.g. via certificate_generator - stays cheap when no summary
+# is generated
+_requests = None
+
+# Found without importing it, so callers can check for requests up front and
+# fall back quietly instead of failing on the first summary
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
+
+
+def _get_requests():
+    """Return the requests module, importing it on first call."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
 # v8.4.0: Standardized narrative voice guidelines
 NARRATIVE_VOICE_GUIDELINES = """
 CRITICAL NARRATIVE VOICE RULES:
@@ -34,20 +78,403 @@ CRITICAL NARRATIVE VOICE RULES:
 6. Start summaries with the document's grade, not AI analysis
 """
 
+# Prompt templates, rendered with str.format_map. Each starts with a static
+# prefix (role and instructions) that is byte-identical across documents of
+# that type, so Ollama can reuse the prefix's KV cache between calls; all
+# per-document fields come after the "---" separator.
+# v8.4.x: Every prefix opens with NARRATIVE_VOICE_GUIDELINES, unchanged, so the
+# voice rules actually reach the model and the shared opening is the same for
+# all four document types.
+_POLICY_PROMPT_PREFIX = NARRATIVE_VOICE_GUIDELINES + """
+You are a policy analyst writing for the general public (reading level: Grade 8).
+
+Write a 400-500 word plain-language summary of the report below that:
+1. Explains what the SPOT grading means in simple terms
+2. Highlights the strongest area
+3. Identifies the weakest area
+4. Addresses AI transparency as noted in the report details
+5. Suggests what this means for the public
+6. Is written in accessible language (no jargon)
+
+CRITICAL WRITING STYLE RULES (v8.4.1):
+- Use SHORT, DIRECT sentences (under 20 words)
+- AVOID: "stakeholders are advised to", "it is important to note", "given the complexity"
+- PREFER: "Consult experts", "Note that", "This is complex"
+- AVOID: "it should be noted that the provisions require careful consideration"
+- PREFER: "Review these provisions carefully"
+- Write at Grade 8 reading level (age 13-14)
+- Use active voice: "The bill does X" not "X is done by the bill"
+- No hedge words: "may", "could potentially", "it appears that"
+"""
+
+_POLICY_PROMPT_TEMPLATE = _POLICY_PROMPT_PREFIX + """---
+Document: {document_title}
+Grade: {grade} | Score: {composite}/100
+Classification: {classification}
+
+Criteria Scores:
+{scores_text}
+{ai_transparency_text}
+{ai_guidance}
+
+Start with: "This policy document received a grade of {grade}..."
+Focus on clarity and directness."""
+
+# Used instead of an LLM call when a policy report has no scores
+_EMPTY_POLICY_SUMMARY_TEMPLATE = """This policy document received a grade of {grade} ({composite}/100).
+
+The report {missing}, so there is nothing further
+to summarize. This usually means the analysis did not complete or the document
+could not be scored. See the full diagnostic report for details."""
+
+_JOURNALISM_PROMPT_PREFIX = NARRATIVE_VOICE_GUIDELINES + """
+You are a media literacy expert writing for general readers.
+
+Write a 300-400 word plain-language summary of the article assessment below that:
+1. Explains the credibility grade in simple terms
+2. Highlights what the article did well
+3. Identifies potential concerns
+4. Suggests what readers should consider
+5. Avoids academic jargon
+"""
+
+_JOURNALISM_PROMPT_TEMPLATE = _JOURNALISM_PROMPT_PREFIX + """---
+Article: {document_title}
+Grade: {grade} | Score: {composite}/100
+
+SPARROW Scale™ Scores:
+{criteria_text}
+
+Start with: "This article received a credibility grade of {grade}..."
+Focus on practical guidance for readers."""
+
+_LEGISLATIVE_PROMPT_PREFIX = NARRATIVE_VOICE_GUIDELINES + """
+You are a legislative analyst writing for the general public (reading level: Grade 10).
+
+IMPORTANT CONTEXT: This is a LEGISLATIVE document (a Bill or Act). Unlike policy proposals:
+- Legislation CREATES legal framework - it defines what IS law, not what SHOULD be
+- Legislation does not need external citations - it IS the primary source
+- Economic projections in legislation are authoritative statutory figures, not proposals
+- The goal is legal clarity, not policy advocacy
+
+Write a 400-500 word analysis of the document below that:
+1. Explains the legislative assessment grade in accessible terms
+2. Evaluates the LEGAL CLARITY of the bill (is the language unambiguous?)
+3. Assesses the REGULATORY SCOPE (what powers does it grant or restrict?)
+4. Reviews IMPLEMENTATION PROVISIONS (are enforcement mechanisms clear?)
+5. Notes any TRANSPARENCY concerns about how the legislation was drafted
+6. Explains what this means for citizens affected by this law
+
+DO NOT:
+- Suggest the legislation needs "revision" or "improvement" (it's enacted law)
+- Critique it as if it were a policy proposal
+- Recommend "stakeholder consultation" (legislative process already occurred)
+- Use phrases like "before implementation" (legislation IS implementation)
+"""
+
+_LEGISLATIVE_PROMPT_TEMPLATE = _LEGISLATIVE_PROMPT_PREFIX + """---
+Document: {document_title}
+Document Type: LEGISLATION (Bill/Act)
+Assessment Grade: {grade} | Score: {composite}/100
+
+Analysis Scores:
+{scores_text}
+{ai_transparency_text}
+
+Start with: "This legislative analysis of {document_title} received a grade of {grade}..."
+Focus on helping citizens understand the law's structure and implications."""
+
+_BUDGET_PROMPT_PREFIX = NARRATIVE_VOICE_GUIDELINES + """
+You are a fiscal analyst writing for taxpayers (reading level: Grade 9).
+
+IMPORTANT CONTEXT: This is a BUDGET document - an official allocation of public funds.
+- Budget figures are authoritative - they represent actual spending commitments
+- Fiscal Transparency is especially important (how clearly is spending itemized?)
+- Economic Rigor matters (are projections realistic and well-supported?)
+
+Write a 400-500 word analysis of the document below that:
+1. Explains the budget assessment grade in plain language
+2. Highlights how clearly spending is itemized and explained
+3. Assesses whether revenue projections appear realistic
+4. Notes any transparency gaps in how funds are allocated
+5. Explains what this means for taxpayers
+"""
+
+_BUDGET_PROMPT_TEMPLATE = _BUDGET_PROMPT_PREFIX + """---
+Document: {document_title}
+Document Type: GOVERNMENT BUDGET
+Assessment Grade: {grade} | Score: {composite}/100
+
+Analysis Scores:
+{scores_text}
+{ai_transparency_text}
+
+Start with: "This budget analysis of {document_title} received a grade of {grade}..."
+Focus on fiscal accountability and taxpayer understanding."""
+
+# Metadata framing around generated summaries, rendered with str.format_map
+_SUMMARY_RULE = "=" * 70
+
+_POLICY_SUMMARY_HEADER = """PLAIN-LANGUAGE SUMMARY
+{rule}
+
+Title: {document_title}
+Grade: {grade} ({composite}/100)
+Classification: {classification}
+Generated: {generated}
+Reading Level: Grade 8+ (Flesch Reading Ease: 60+)"""
+
+_POLICY_SUMMARY_TRAILER = """About This Summary:
+This summary was automatically generated using AI language models to make
+the SPOT Scale™ grading understandable to the general public. For technical
+details, see the full diagnostic report.
+
+SPOT Scale™ Criteria Explained:
+- FT (Fiscal Transparency): How clearly are financial details disclosed?
+- SB (Stakeholder Balance): Are different perspectives represented fairly?
+- ER (Economic Rigor): Is the economic analysis sound?
+- PA (Public Accessibility): How easy is this to understand?
+- PC (Policy Consequentiality): How much impact will this have?
+- AT (AI Transparency): How much AI assistance was used and is it disclosed?
+
+For full details, visit: https://sparrowspot.example/
+"""
+
+_JOURNALISM_SUMMARY_HEADER = """CREDIBILITY ASSESSMENT SUMMARY
+{rule}
+
+Title: {document_title}
+Grade: {grade} ({composite}/100)
+Generated: {generated}
+Reading Level: Grade 8+ (General Public)"""
+
+_JOURNALISM_SUMMARY_TRAILER = """SPARROW Scale™ Explained:
+- SI (Source Integrity): Are sources credible and cited?
+- OI (Objectivity Index): How balanced is the reporting?
+- TP (Technical Precision): Is information accurate?
+- AR (Accessibility): How easy is it to understand?
+- IU (Impact Utility): How important is this information?
+
+Reading Tips:
+✓ Check the sources cited
+✓ Look for multiple viewpoints
+✓ Consider what information might be missing
+✓ Verify claims with independent sources
+
+For full analysis, visit: https://sparrowspot.example/
+"""
+
+_LEGISLATIVE_SUMMARY_HEADER = """LEGISLATIVE ANALYSIS SUMMARY
+{rule}
+
+Title: {document_title}
+Document Type: Legislation (Bill/Act)
+Assessment Grade: {grade} ({composite}/100)
+Generated: {generated}
+Reading Level: Grade 10+ (Civic Literacy)"""
+
+_LEGISLATIVE_SUMMARY_TRAILER = """About This Analysis:
+This analysis was generated to help citizens understand legislative documents.
+Legislation is a PRIMARY SOURCE - it creates law rather than proposing policy.
+
+Assessment Criteria for Legislation:
+- FT (Fiscal Transparency): How clearly are budgetary provisions disclosed?
+- SB (Stakeholder Balance): Does the legislation consider diverse affected parties?
+- ER (Economic Rigor): Are economic provisions well-defined and calculable?
+- PA (Public Accessibility): How readable is the legislative language?
+- PC (Policy Consequentiality): What real-world changes does this law create?
+- AT (AI Transparency): Was AI assistance used in drafting or analysis?
+
+Note: Legislative documents are self-authorizing and do not require external
+citations in the same way policy proposals do.
+
+For full technical analysis, see the complete assessment report.
+"""
+
+_BUDGET_SUMMARY_HEADER = """BUDGET ANALYSIS SUMMARY
+{rule}
+
+Title: {document_title}
+Document Type: Government Budget
+Assessment Grade: {grade} ({composite}/100)
+Generated: {generated}
+Reading Level: Grade 9+ (Taxpayer Literacy)"""
+
+_BUDGET_SUMMARY_TRAILER = """Budget Assessment Criteria:
+- FT (Fiscal Transparency): How clearly is spending itemized?
+- SB (Stakeholder Balance): Are different sectors fairly represented?
+- ER (Economic Rigor): Are revenue/spending projections realistic?
+- PA (Public Accessibility): Can taxpayers understand the allocations?
+- PC (Policy Consequentiality): What real-world impact will spending have?
+
+For full technical analysis, see the complete assessment report.
+"""
+
+
+@dataclass(frozen=True)
+class SummaryTemplate:
+    """Static text and labels for one summary type."""
+    name: str                   # Purpose prefix in the AI call log
+    status: str                 # Progress line printed before generating
+    title_label: str            # "Document"/"Article" in the progress output
+    type_label: Optional[str]   # Printed as "Type: ..." when set
+    prompt: str                 # format_map template for the Ollama prompt
+    header: str                 # format_map template above the summary
+    trailer: str                # Fixed text below the summary
+
+
+_POLICY_SUMMARY = SummaryTemplate(
+    name="policy",
+    status="📝 Generating plain-language summary (Ollama)...",
+    title_label="Document",
+    type_label=None,
+    prompt=_POLICY_PROMPT_TEMPLATE,
+    header=_POLICY_SUMMARY_HEADER,
+    trailer=_POLICY_SUMMARY_TRAILER,
+)
+
+_JOURNALISM_SUMMARY = SummaryTemplate(
+    name="journalism",
+    status="📝 Generating credibility summary (Ollama)...",
+    title_label="Article",
+    type_label=None,
+    prompt=_JOURNALISM_PROMPT_TEMPLATE,
+    header=_JOURNALISM_SUMMARY_HEADER,
+    trailer=_JOURNALISM_SUMMARY_TRAILER,
+)
+
+_LEGISLATIVE_SUMMARY = SummaryTemplate(
+    name="legislative",
+    status="📝 Generating legislative analysis summary (Ollama)...",
+    title_label="Document",
+    type_label="LEGISLATION",
+    prompt=_LEGISLATIVE_PROMPT_TEMPLATE,
+    header=_LEGISLATIVE_SUMMARY_HEADER,
+    trailer=_LEGISLATIVE_SUMMARY_TRAILER,
+)
+
+_BUDGET_SUMMARY = SummaryTemplate(
+    name="budget",
+    status="📝 Generating budget analysis summary (Ollama)...",
+    title_label="Document",
+    type_label="BUDGET",
+    prompt=_BUDGET_PROMPT_TEMPLATE,
+    header=_BUDGET_SUMMARY_HEADER,
+    trailer=_BUDGET_SUMMARY_TRAILER,
+)
+
 
 class OllamaSummaryGenerator:
     """Generate plain-language summaries using Ollama models."""
     
-    def __init__(self, ollama_url: str = "http://localhost:11434"):
-        """Initialize with Ollama endpoint."""
+    # Successful test_connection() results per URL (monotonic time), shared by
+    # all instances so batch drivers don't re-probe for every report
+    _conn_cache: Dict[str, float] = {}
+    _CONN_CACHE_TTL = 30.0
+    
+    # Circuit breaker: this many consecutive failed calls pause Ollama calls
+    _CIRCUIT_FAILURES = 3
+    _CIRCUIT_COOLDOWN = 60.0
+    
+    # Cached generations older than this (seconds) are regenerated
+    _CACHE_TTL = 7 * 24 * 3600.0
+    
+    def __init__(self, ollama_url: str = "http://localhost:11434",
+                 cache_dir: Optional[str] = None, verbose: bool = True,
+                 keep_alive: str = "30m"):
+        """
+        Initialize with Ollama endpoint.
+        
+        Args:
+            ollama_url: Base URL of the Ollama server
+            cache_dir: Directory for cached generations keyed by model and
+                prompt. None uses $SPOT_SUMMARY_CACHE, else ~/.cache/spot_ollama;
+                an empty string disables the cache. Entries expire after 7 days.
+            verbose: Print progress messages; warnings and errors are always
+                printed (turn off for quiet batch runs)
+            keep_alive: How long Ollama keeps a model loaded after each call
+                (Ollama duration string, e.g. "30m"); release_gpu() frees it early
+        """
         self.ollama_url = ollama_url
+        self.verbose = verbose
+        if cache_dir is None:
+            cache_dir = os.environ.get("SPOT_SUMMARY_CACHE", "~/.cache/spot_ollama")
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.stats = {"cache_hits": 0, "cache_misses": 0}
         self.model = "granite4:tiny-h"  # Fast, accurate model
         self.fallback_model = "qwen2.5:7b"  # More capable fallback
+        # Generation options sent to Ollama. num_predict leaves headroom over the
+        # ~670 tokens of a 500-word summary; num_ctx fits the longest prompt
+        # (~600 tokens) plus output without Ollama defaulting to a larger window
+        self.temperature = 0.7
+        self.num_predict = 800
+        self.num_ctx = 2048
+        self.keep_alive = keep_alive
+        self._warmed = False
+        # Optional callback receiving each streamed text fragment as it arrives
+        # (e.g. to echo progress in the CLI); not meant for concurrent batches
+        self.on_token: Optional[Callable[[str], None]] = None
         # v8.4.1: AI Contribution tracking for provenance
         self.ai_calls: List[Dict[str, Any]] = []
         self._call_counter = 0
-        self._models_used: set = set()  # Track which models were actually called
-        
+        self._models_used: Dict[str, float] = {}  # Model -> last call (monotonic time)
+        self._missing_models: set = set()  # Models Ollama answered 404 for (not installed)
+        self._lock = threading.Lock()  # Guards counters/stats and lazy session setup
+        self._local = threading.local()  # Per-thread flags (refresh: skip the response cache)
+        # Liveness probe result, reused for a few seconds so a down server
+        # fails fast instead of timing out once per model
+        self._alive: Optional[bool] = None
+        self._alive_checked_at = 0.0
+        self._alive_ttl = 5.0
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        self._session = None
+        # Recent successful generation times (seconds) per model, used to
+        # cut off calls that run far beyond that model's usual latency
+        self._latency: Dict[str, deque] = defaultdict(lambda: deque(maxlen=32))
+    
+    @property
+    def session(self):
+        """Pooled keep-alive connections to Ollama, shared by all API calls."""
+        with self._lock:
+            if self._session is None:
+                requests = _get_requests()
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                session.headers.update({"Content-Type": "application/json"})
+                session.mount("http://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    # POST must be listed explicitly: urllib3 does not retry it by default.
+                    # read=False: a read timeout means Ollama is already generating,
+                    # and resending would start the whole generation again; it is
+                    # raised as a plain ReadTimeout instead
+                    max_retries=Retry(total=3, read=False, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                                      allowed_methods=["GET", "POST"])
+                ))
+                self._session = session
+            return self._session
+    
+    def _info(self, message: str) -> None:
+        """Print a progress message unless running quietly."""
+        if self.verbose:
+            print(message)
+    
+    def close(self) -> None:
+        """Close pooled connections (a new session is opened if used again)."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+    
+    def __enter__(self) -> "OllamaSummaryGenerator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def get_ai_calls_log(self) -> List[Dict[str, Any]]:
         """Return log of all AI calls made during this session."""
         return self.ai_calls.copy()
@@ -74,7 +501,7 @@ class OllamaSummaryGenerator:
         try:
             # Ollama keeps models in memory with keep_alive
             # Setting keep_alive to 0 unloads immediately
-            response = requests.post(
+            response = self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": model,
@@ -84,38 +511,99 @@ class OllamaSummaryGenerator:
                 timeout=10
             )
             if response.status_code == 200:
-                print(f"🧹 Model {model} unloaded from memory")
+                self._info(f"🧹 Model {model} unloaded from memory")
                 return True
         except Exception as e:
             print(f"⚠️  Could not unload model {model}: {e}")
         return False
     
-    def cleanup(self) -> None:
+    def _generation_options(self) -> Dict[str, Any]:
+        """Ollama options sent with every generation."""
+        return {
+            "temperature": self.temperature,
+            "num_predict": self.num_predict,
+            "num_ctx": self.num_ctx,
+        }
+    
+    def warm_up(self) -> bool:
         """
-        Full cleanup: clear logs and unload only models that were used.
+        Load the primary model ahead of the first summary (once per generator).
         
-        v8.4.1: Call this after analysis to free GPU memory.
+        An empty prompt makes Ollama load the model and return without
+        generating, so the cold-start delay is paid here rather than on the
+        first user-visible summary.
         """
-        # Only unload models that were actually used this session
-        for model in self._models_used:
-            self.unload_model(model)
+        if self._warmed:
+            return True
+        if self.model in self._missing_models:
+            return False
+        requests = _get_requests()
+        try:
+            response = self.session.post(
+                f"{self.ollama_url}/api/generate",
+                # Same options as real calls: a different num_ctx would make
+                # Ollama reload the model on the first summary
+                json={"model": self.model, "prompt": "", "keep_alive": self.keep_alive,
+                      "options": {**self._generation_options(), "num_predict": 1}},
+                timeout=(10, 300)
+            )
+            if response.status_code == 200:
+                self._warmed = True
+                self._models_used[self.model] = time.monotonic()
+                self._info(f"🔥 Model {self.model} loaded")
+                return True
+            if response.status_code == 404:
+                # Not installed: summaries go straight to the fallback model
+                with self._lock:
+                    self._missing_models.add(self.model)
+                print(f"⚠️  Could not preload model {self.model}: not installed")
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  Could not preload model {self.model}: {e}")
+        return False
+    
+    def release_gpu(self) -> None:
+        """
+        Unload the models used this session to free GPU memory.
         
+        v8.4.1: Call this at the end of a job. Models are otherwise left loaded
+        (for keep_alive) so the next document doesn't pay the load time again.
+        """
+        # Only unload models that were actually used this session, least
+        # recently used first
+        for model in sorted(self._models_used, key=self._models_used.get):
+            self.unload_model(model)
+    
+    def cleanup(self) -> None:
+        """Clear logs and close pooled connections (models stay loaded; see release_gpu)."""
         self.clear_ai_calls_log()
+        self.close()
         
-    def _call_ollama(self, prompt: str, model: Optional[str] = None, purpose: str = "generation") -> str:
-        """Call Ollama API for text generation with provenance tracking."""
-        model = model or self.model
-        self._call_counter += 1
-        call_id = self._call_counter
-        start_time = datetime.now()
+    def _call_ollama(self, prompt: str, model: Optional[str] = None, purpose: str = "generation",
+                     token_budget: Optional[int] = None) -> str:
+        """
+        Call Ollama API for text generation with provenance tracking.
         
-        # v8.4.1: Track which models are used for cleanup
-        self._models_used.add(model)
+        The response is streamed and assembled chunk by chunk, so nothing
+        beyond the generated text is buffered. If token_budget is given,
+        reading stops after that many streamed tokens to cap latency.
+        
+        Once a model has a few timed calls, a generation still streaming after
+        twice its median generation time is abandoned as a Timeout so the
+        caller can move on to the fallback model instead of waiting out a
+        stalled request. Generation is timed from the first streamed chunk,
+        so time spent queued behind other requests on the server doesn't
+        count against it.
+        """
+        model = model or self.model
+        with self._lock:
+            self._call_counter += 1
+            call_id = self._call_counter
+        start_ns = time.perf_counter_ns()  # Monotonic, for duration_ms
         
         # v8.4.1: Prepare call log entry
         call_log = {
             "call_id": call_id,
-            "timestamp": start_time.isoformat(),
+            "timestamp": datetime.now().isoformat(),
             "model": model,
             "purpose": purpose,
             "prompt_length": len(prompt),
@@ -123,43 +611,234 @@ class OllamaSummaryGenerator:
             "status": "pending",
             "response_length": 0,
             "duration_ms": 0,
-            "error": None
+            "error": None,
+            "cached": False
         }
         
+        options = self._generation_options()
+        
+        # Identical model + options + prompt was generated before: reuse it
+        cache_path = self._cache_path(model, options, prompt)
+        cached = None if getattr(self._local, "refresh", False) else self._read_cache(cache_path)
+        if cache_path is not None:
+            with self._lock:
+                self.stats["cache_misses" if cached is None else "cache_hits"] += 1
+        if cached is not None:
+            # Still a successful model output for provenance; cached marks reuse
+            call_log["status"] = "success"
+            call_log["cached"] = True
+            call_log["response_length"] = len(cached)
+            self.ai_calls.append(call_log)
+            return cached
+        
+        # v8.4.1: Track which models are used for release_gpu()
+        self._models_used[model] = time.monotonic()
+        
+        requests = _get_requests()
+        # Calls skipped by the open circuit aren't failures: counting them would
+        # restart the cooldown on every skipped call, so it would never close
+        counts_as_failure = True
         try:
-            response = requests.post(
+            if time.monotonic() < self._circuit_open_until:
+                counts_as_failure = False
+                raise requests.exceptions.ConnectionError(
+                    f"skipped: {self._CIRCUIT_FAILURES} consecutive Ollama failures, pausing calls")
+            if not self._is_alive():
+                raise requests.exceptions.ConnectionError(f"Ollama not reachable at {self.ollama_url}")
+            
+            deadline = self._deadline_for(model)
+            started = None  # Time of the first streamed chunk
+            parts = []
+            truncated = False
+            on_token = self.on_token
+            with self.session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": model,
                     "prompt": prompt,
-                    "stream": False,
-                    "temperature": 0.7,
-                    "num_predict": 800,
+                    "stream": True,
+                    "options": options,
+                    "keep_alive": self.keep_alive,
                 },
-                timeout=(10, 300)  # (connect timeout, read timeout) - 5 min for large models
-            )
-            response.raise_for_status()
-            result = response.json()["response"]
+                # (connect timeout, read timeout) - 5 min for large models on a
+                # cold start or a request queued behind others
+                timeout=(10, 300),
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    if started is None:
+                        started = time.monotonic()
+                    # The final chunk carries the large "context" token array
+                    chunk = _json_loads(line)
+                    if "error" in chunk:
+                        raise requests.exceptions.RequestException(chunk["error"])
+                    text = chunk.get("response", "")
+                    parts.append(text)
+                    if on_token and text:
+                        on_token(text)
+                    if chunk.get("done"):
+                        break
+                    if deadline and time.monotonic() - started > deadline:
+                        # A slow generation, not a server fault: leave the breaker alone
+                        counts_as_failure = False
+                        raise requests.exceptions.Timeout(
+                            f"generation exceeded {deadline:.0f}s (2x {model} median latency)")
+                    if token_budget and len(parts) >= token_budget:
+                        truncated = True
+                        break
+            result = "".join(parts)
+            
+            if not truncated and started is not None:
+                self._latency[model].append(time.monotonic() - started)
+                self._write_cache(cache_path, result)
             
             # v8.4.1: Log successful call
-            end_time = datetime.now()
             call_log["status"] = "success"
             call_log["response_length"] = len(result)
-            call_log["duration_ms"] = int((end_time - start_time).total_seconds() * 1000)
+            call_log["duration_ms"] = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.ai_calls.append(call_log)
+            self._consecutive_failures = 0
             
             return result
-        except requests.exceptions.RequestException as e:
-            # v8.4.1: Log failed call
-            end_time = datetime.now()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            response = getattr(e, "response", None)
+            with self._lock:
+                if response is not None and response.status_code == 404:
+                    # Model not installed: a permanent condition, not a server fault
+                    self._missing_models.add(model)
+                elif counts_as_failure:
+                    # After the cooldown one real attempt goes through; if it
+                    # fails too, the count is still over the limit and the
+                    # circuit opens again
+                    self._consecutive_failures += 1
+                    if self._consecutive_failures >= self._CIRCUIT_FAILURES:
+                        self._circuit_open_until = time.monotonic() + self._CIRCUIT_COOLDOWN
+
+            # v8.4.1: Log failed call (ValueError: malformed stream line)
             call_log["status"] = "error"
             call_log["error"] = str(e)
-            call_log["duration_ms"] = int((end_time - start_time).total_seconds() * 1000)
+            call_log["duration_ms"] = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.ai_calls.append(call_log)
             
             print(f"⚠️  Ollama error with {model}: {str(e)}")
             return None
     
+    def _deadline_for(self, model: str) -> Optional[float]:
+        """Adaptive limit on generation time (from the first streamed chunk), or None until 3 calls are timed."""
+        samples = self._latency.get(model)
+        if not samples or len(samples) < 3:
+            return None
+        return max(10.0, 2 * statistics.median(samples))
+    
+    def _is_alive(self) -> bool:
+        """Quick /api/tags probe, cached for _alive_ttl seconds."""
+        now = time.monotonic()
+        if self._alive is None or now - self._alive_checked_at > self._alive_ttl:
+            requests = _get_requests()
+            try:
+                # Plain request: the session's retry policy would slow the probe down
+                self._alive = requests.get(f"{self.ollama_url}/api/tags", timeout=1).ok
+            except requests.exceptions.RequestException:
+                self._alive = False
+            self._alive_checked_at = now
+        return self._alive
+    
+    def _cache_path(self, model: str, options: Dict[str, Any], prompt: str) -> Optional[Path]:
+        """Cache file for a model/options/prompt combination, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        key_source = f"{model}\0{json.dumps(options, sort_keys=True)}\0{prompt}"
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.txt"
+    
+    @classmethod
+    def _read_cache(cls, path: Optional[Path]) -> Optional[str]:
+        """Return cached text, or None on a miss, expired entry or unreadable cache."""
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime > cls._CACHE_TTL:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _write_cache(path: Optional[Path], text: str) -> None:
+        """Atomically store text in the cache; failures are non-fatal."""
+        if path is None or not text:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    
+    def _call_with_fallback(self, prompt: str, purpose: str) -> Optional[str]:
+        """Generate with the primary model, retrying once on the fallback model."""
+        # A primary model that is not installed is skipped rather than retried
+        summary = None
+        if self.model in self._missing_models:
+            print(f"⚠️  Primary model {self.model} not installed, using fallback...")
+        else:
+            summary = self._call_ollama(prompt, purpose=purpose)
+            if not summary:
+                print("⚠️  Primary model failed, trying fallback...")
+        
+        if not summary:
+            summary = self._call_ollama(prompt, self.fallback_model, purpose=f"{purpose}_fallback")
+        
+        if not summary:
+            print("❌ Summary generation failed")
+        return summary
+    
+    def _render_summary(self, template: "SummaryTemplate", fields: Dict[str, Any],
+                        output_file: Optional[str]) -> Optional[str]:
+        """Prompt Ollama for one summary type and frame the result.
+        
+        fields supplies every placeholder of the template's prompt and header.
+        """
+        self._info(template.status)
+        self._info(f"   Model: {self.model}")
+        self._info(f"   {template.title_label}: {fields['document_title']}")
+        if template.type_label:
+            self._info(f"   Type: {template.type_label}")
+        
+        summary = self._call_with_fallback(template.prompt.format_map(fields), purpose=f"{template.name}_summary")
+        if not summary:
+            return None
+        
+        return self._finish_summary(summary, template, fields, output_file)
+    
+    def _finish_summary(self, summary: str, template: "SummaryTemplate",
+                        fields: Dict[str, Any], output_file: Optional[str]) -> str:
+        """Frame summary text with its metadata header/trailer and optionally save it.
+        
+        Returns output_file if the summary was written, else the full text.
+        """
+        header = template.header.format_map({
+            **fields,
+            "rule": _SUMMARY_RULE,
+            "generated": datetime.now().strftime('%B %d, %Y'),
+        })
+        full_summary = f"{header}\n\n{_SUMMARY_RULE}\n\n{summary.strip()}\n\n{_SUMMARY_RULE}\n\n{template.trailer}"
+        
+        # Save to file if specified (via a temp file, so a crash never leaves a partial summary)
+        if output_file:
+            tmp_file = f"{output_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(full_summary)
+            os.replace(tmp_file, output_file)
+            self._info(f"   ✓ Saved: {output_file}")
+            return output_file
+        
+        return full_summary
+    
     def generate_policy_summary(
         self, 
         report: Dict[str, Any],
@@ -174,146 +853,82 @@ class OllamaSummaryGenerator:
         classification = report.get('classification', '')
         
         # Build context from report
-        scores_text = "\n".join([
+        scores_text = "\n".join(
             f"- {name}: {data.get('score', 'N/A')}/100"
             for name, data in criteria.items()
-        ])
+        )
         
         # v8.3.3: Include AI Transparency dimension if available
         # v8.4.0: Handle INCONCLUSIVE detection
         # v8.4.2: Deep analysis consensus takes precedence over INCONCLUSIVE flag
         ai_transparency_text = ""
-        ai_detection = report.get('ai_detection', {})
-        detection_inconclusive = ai_detection.get('detection_inconclusive', False)
+        ai_detection = report.get('ai_detection') or {}
         detection_spread = ai_detection.get('detection_spread', 0)
         
-        deep_analysis = report.get('deep_analysis', {})
-        has_deep_consensus = deep_analysis and 'consensus' in deep_analysis
+        deep_analysis = report.get('deep_analysis') or {}
+        # v8.4.2: Only treat detection as INCONCLUSIVE if deep analysis consensus is NOT available
+        show_inconclusive = (
+            (ai_detection.get('detection_inconclusive', False) or detection_spread > 0.50)
+            and 'consensus' not in deep_analysis
+        )
         
         if deep_analysis:
-            consensus = deep_analysis.get('consensus', {})
+            consensus = deep_analysis.get('consensus') or {}
             ai_percentage = consensus.get('ai_percentage', 0)
             transparency_score = consensus.get('transparency_score', 0)
             primary_model = consensus.get('primary_model', 'Unknown')
             
-            # v8.4.2: Only show INCONCLUSIVE if deep analysis consensus is NOT available
-            if (detection_inconclusive or detection_spread > 0.50) and not has_deep_consensus:
-                ai_transparency_text = f"""
-
-AI Transparency (AT):
-⚠️ AI DETECTION IS INCONCLUSIVE
-- Detection methods disagreed by {detection_spread*100:.0f}% (exceeds 50% threshold)
-- AI Content: CANNOT BE RELIABLY DETERMINED
-- Model Attribution: SUPPRESSED (inconclusive data)
-- Note: Professional manual review is recommended"""
-                scores_text += f"\n- AT (AI Transparency): INCONCLUSIVE"
-            elif transparency_score > 0:
-                ai_transparency_text = f"""
-
-AI Transparency (AT):
-- AI Content Detected: {ai_percentage:.1f}% (estimate, not verified)
-- Likely AI Model: {primary_model}
-- Transparency Score: {transparency_score}/100
-- Note: AI detection is probabilistic, not definitive"""
-                scores_text += f"\n- AT (AI Transparency): {transparency_score}/100"
-        
-        # v8.4.2: Build INCONCLUSIVE-aware prompt (only if no deep consensus)
-        if (detection_inconclusive or detection_spread > 0.50) and not has_deep_consensus:
-            ai_guidance = """
-IMPORTANT: AI detection is INCONCLUSIVE for this document. Do NOT claim any specific
-AI percentage as fact. Say "AI detection was inconclusive" and recommend manual review.
-Do NOT name any AI model as the likely source."""
-        else:
-            ai_guidance = """
-If AI content was detected, briefly explain what this means for transparency.
-Use hedging language: "appears to", "may contain", "patterns suggest"."""
-        
-        prompt = f"""You are a policy analyst writing for the general public (reading level: Grade 8).
-
-Document: {document_title}
-Grade: {grade} | Score: {composite}/100
-Classification: {classification}
-
-Criteria Scores:
-{scores_text}
-{ai_transparency_text}
-{ai_guidance}
-
-Write a 400-500 word plain-language summary that:
-1. Explains what the SPOT grading means in simple terms
-2. Highlights the strongest area
-3. Identifies the weakest area
-4. Addresses AI transparency as noted above
-5. Suggests what this means for the public
-6. Is written in accessible language (no jargon)
-
-CRITICAL WRITING STYLE RULES (v8.4.1):
-- Use SHORT, DIRECT sentences (under 20 words)
-- AVOID: "stakeholders are advised to", "it is important to note", "given the complexity"
-- PREFER: "Consult experts", "Note that", "This is complex"
-- AVOID: "it should be noted that the provisions require careful consideration"
-- PREFER: "Review these provisions carefully"
-- Write at Grade 8 reading level (age 13-14)
-- Use active voice: "The bill does X" not "X is done by the bill"
-- No hedge words: "may", "could potentially", "it appears that"
-
-Start with: "This policy document received a grade of {grade}..."
-Focus on clarity and directness."""
-
-        print("📝 Generating plain-language summary (Ollama)...")
-        print(f"   Model: {self.model}")
-        print(f"   Document: {document_title}")
-        
-        summary = self._call_ollama(prompt, purpose="policy_summary")
-        
-        if not summary:
-            print("⚠️  Primary model failed, trying fallback...")
-            summary = self._call_ollama(prompt, self.fallback_model, purpose="policy_summary_fallback")
-        
-        if not summary:
-            print("❌ Summary generation failed")
-            return None
-        
-        # Add metadata
-        full_summary = f"""PLAIN-LANGUAGE SUMMARY
-{'=' * 70}
-
-Title: {document_title}
-Grade: {grade} ({composite}/100)
-Classification: {classification}
-Generated: {datetime.now().strftime('%B %d, %Y')}
-Reading Level: Grade 8+ (Flesch Reading Ease: 60+)
-
-{'=' * 70}
-
-{summary.strip()}
-
-{'=' * 70}
-
-About This Summary:
-This summary was automatically generated using AI language models to make
-the SPOT Scale™ grading understandable to the general public. For technical
-details, see the full diagnostic report.
+            if show_inconclusive:
+                ai_transparency_text = f"""
 
-SPOT Scale™ Criteria Explained:
-- FT (Fiscal Transparency): How clearly are financial details disclosed?
-- SB (Stakeholder Balance): Are different perspectives represented fairly?
-- ER (Economic Rigor): Is the economic analysis sound?
-- PA (Public Accessibility): How easy is this to understand?
-- PC (Policy Consequentiality): How much impact will this have?
-- AT (AI Transparency): How much AI assistance was used and is it disclosed?
+AI Transparency (AT):
+⚠️ AI DETECTION IS INCONCLUSIVE
+- Detection methods disagreed by {detection_spread*100:.0f}% (exceeds 50% threshold)
+- AI Content: CANNOT BE RELIABLY DETERMINED
+- Model Attribution: SUPPRESSED (inconclusive data)
+- Note: Professional manual review is recommended"""
+                scores_text += f"\n- AT (AI Transparency): INCONCLUSIVE"
+            elif transparency_score > 0:
+                ai_transparency_text = f"""
 
-For full details, visit: https://sparrowspot.example/
-"""
+AI Transparency (AT):
+- AI Content Detected: {ai_percentage:.1f}% (estimate, not verified)
+- Likely AI Model: {primary_model}
+- Transparency Score: {transparency_score}/100
+- Note: AI detection is probabilistic, not definitive"""
+                scores_text += f"\n- AT (AI Transparency): {transparency_score}/100"
         
-        # Save to file if specified
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_summary)
-            print(f"   ✓ Saved: {output_file}")
-            return output_file
+        # v8.4.2: Build INCONCLUSIVE-aware prompt (only if no deep consensus)
+        if show_inconclusive:
+            ai_guidance = """
+IMPORTANT: AI detection is INCONCLUSIVE for this document. Do NOT claim any specific
+AI percentage as fact. Say "AI detection was inconclusive" and recommend manual review.
+Do NOT name any AI model as the likely source."""
+        else:
+            ai_guidance = """
+If AI content was detected, briefly explain what this means for transparency.
+Use hedging language: "appears to", "may contain", "patterns suggest"."""
         
-        return full_summary
+        fields = {
+            "document_title": document_title,
+            "grade": grade,
+            "composite": composite,
+            "classification": classification,
+            "scores_text": scores_text,
+            "ai_transparency_text": ai_transparency_text,
+            "ai_guidance": ai_guidance,
+        }
+        
+        if not criteria or not composite:
+            # Fast path for empty/placeholder reports: no scores to explain,
+            # so skip the LLM and use a fixed template
+            missing = ("does not contain any criteria scores" if not criteria
+                       else "has no overall (composite) score")
+            self._info(f"📝 Report {missing} - using template summary (no LLM call)")
+            summary = _EMPTY_POLICY_SUMMARY_TEMPLATE.format_map({**fields, "missing": missing})
+            return self._finish_summary(summary, _POLICY_SUMMARY, fields, output_file)
+        
+        return self._render_summary(_POLICY_SUMMARY, fields, output_file)
     
     def generate_journalism_summary(
         self,
@@ -328,89 +943,25 @@ For full details, visit: https://sparrowspot.example/
         grade = scores.get('composite', {}).get('grade', ('F', 'Unknown'))[0]
         
         # Build context
-        criteria_text = "\n".join([
+        criteria_text = "\n".join(
             f"- {abbr.upper()}: {data.get('score', 'N/A')}/100"
             for abbr, data in scores.items() if abbr != 'composite'
-        ])
-        
-        prompt = f"""You are a media literacy expert writing for general readers.
-
-Article: {document_title}
-Grade: {grade} | Score: {composite}/100
-
-SPARROW Scale™ Scores:
-{criteria_text}
-
-Write a 300-400 word plain-language summary that:
-1. Explains the credibility grade in simple terms
-2. Highlights what the article did well
-3. Identifies potential concerns
-4. Suggests what readers should consider
-5. Avoids academic jargon
-
-Start with: "This article received a credibility grade of {grade}..."
-Focus on practical guidance for readers."""
-
-        print("📝 Generating credibility summary (Ollama)...")
-        print(f"   Model: {self.model}")
-        print(f"   Article: {document_title}")
-        
-        summary = self._call_ollama(prompt, purpose="journalism_summary")
-        
-        if not summary:
-            print("⚠️  Primary model failed, trying fallback...")
-            summary = self._call_ollama(prompt, self.fallback_model, purpose="journalism_summary_fallback")
-        
-        if not summary:
-            print("❌ Summary generation failed")
-            return None
-        
-        # Add metadata
-        full_summary = f"""CREDIBILITY ASSESSMENT SUMMARY
-{'=' * 70}
-
-Title: {document_title}
-Grade: {grade} ({composite}/100)
-Generated: {datetime.now().strftime('%B %d, %Y')}
-Reading Level: Grade 8+ (General Public)
-
-{'=' * 70}
-
-{summary.strip()}
-
-{'=' * 70}
-
-SPARROW Scale™ Explained:
-- SI (Source Integrity): Are sources credible and cited?
-- OI (Objectivity Index): How balanced is the reporting?
-- TP (Technical Precision): Is information accurate?
-- AR (Accessibility): How easy is it to understand?
-- IU (Impact Utility): How important is this information?
-
-Reading Tips:
-✓ Check the sources cited
-✓ Look for multiple viewpoints
-✓ Consider what information might be missing
-✓ Verify claims with independent sources
-
-For full analysis, visit: https://sparrowspot.example/
-"""
-        
-        # Save to file if specified
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_summary)
-            print(f"   ✓ Saved: {output_file}")
-            return output_file
+        )
         
-        return full_summary
+        return self._render_summary(_JOURNALISM_SUMMARY, {
+            "document_title": document_title,
+            "grade": grade,
+            "composite": composite,
+            "criteria_text": criteria_text,
+        }, output_file)
     
     def generate_quick_summary(
         self,
         json_file: str,
         variant: str = 'policy',
         document_type: str = None,
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        force: bool = False
     ) -> str:
         """Generate summary from existing JSON report.
         
@@ -419,10 +970,17 @@ For full analysis, visit: https://sparrowspot.example/
             variant: 'policy' or 'journalism'
             document_type: Override document type (legislation, budget, policy_brief, etc.)
             output_file: Optional output path
+            force: Regenerate (bypassing the response cache) even if output_file
+                already holds a summary of this kind newer than json_file
         """
+        if not output_file:
+            # Only strip a trailing .json; .json elsewhere in the path is kept
+            json_path = Path(json_file)
+            stem = json_path.stem if json_path.suffix == '.json' else json_path.name
+            output_file = str(json_path.with_name(f"{stem}_summary.txt"))
         
-        with open(json_file, 'r') as f:
-            report = json.load(f)
+        with open(json_file, 'rb') as f:
+            report = _json_loads(f.read())
         
         doc_title = report.get('document_title', 'Document')
         
@@ -430,19 +988,85 @@ For full analysis, visit: https://sparrowspot.example/
         if not document_type:
             document_type = report.get('document_type', 'policy_brief')
         
-        if not output_file:
-            base = json_file.replace('.json', '')
-            output_file = f"{base}_summary.txt"
-        
         # Route to appropriate generator based on document type
         if document_type == 'legislation':
-            return self.generate_legislative_summary(report, doc_title, output_file)
+            generate, template = self.generate_legislative_summary, _LEGISLATIVE_SUMMARY
         elif document_type == 'budget':
-            return self.generate_budget_summary(report, doc_title, output_file)
+            generate, template = self.generate_budget_summary, _BUDGET_SUMMARY
         elif variant == 'journalism':
-            return self.generate_journalism_summary(report, doc_title, output_file)
+            generate, template = self.generate_journalism_summary, _JOURNALISM_SUMMARY
         else:
-            return self.generate_policy_summary(report, doc_title, output_file)
+            generate, template = self.generate_policy_summary, _POLICY_SUMMARY
+        
+        # Up-to-date summary of the same kind from an earlier run: reuse it
+        # without an LLM call
+        if not force and self._summary_is_current(output_file, json_file, template):
+            self._info(f"✓ Up to date: {output_file}")
+            return output_file
+        
+        # force also skips the response cache, or the same text would come back
+        self._local.refresh = force
+        try:
+            return generate(report, doc_title, output_file)
+        finally:
+            self._local.refresh = False
+    
+    @staticmethod
+    def _summary_is_current(output_file: str, json_file: str, template: "SummaryTemplate") -> bool:
+        """True if output_file is newer than json_file and holds a summary of template's kind."""
+        try:
+            if os.path.getmtime(output_file) <= os.path.getmtime(json_file):
+                return False
+            with open(output_file, encoding='utf-8') as f:
+                # The header's first line names the kind of summary
+                return f.readline().rstrip('\n') == template.header.split('\n', 1)[0]
+        except OSError:
+            return False
+    
+    def generate_batch(
+        self,
+        json_dir: str,
+        variant: str = 'policy',
+        max_workers: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Generate summaries for every *.json report in a directory concurrently.
+        
+        Args:
+            json_dir: Directory containing analysis JSON files
+            variant: 'policy' or 'journalism' (document_type routing still applies)
+            max_workers: Concurrent reports; defaults to $OLLAMA_NUM_PARALLEL or 4
+        
+        Returns:
+            Output paths in sorted filename order (None where a report failed)
+        """
+        json_files = sorted(glob.glob(os.path.join(json_dir, "*.json")))
+        if max_workers is None:
+            # The variable belongs to the Ollama server; ignore unusable values
+            try:
+                max_workers = int(os.environ.get("OLLAMA_NUM_PARALLEL", 4))
+            except ValueError:
+                max_workers = 4
+        max_workers = max(1, max_workers)
+        
+        results: List[Optional[str]] = [None] * len(json_files)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.generate_quick_summary, json_file, variant): i
+                for i, json_file in enumerate(json_files)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    # One bad file (unreadable, not JSON, not a report) must not stop the batch
+                    print(f"⚠️  Could not summarize {json_files[i]}: {e}")
+                if self.verbose:
+                    sys.stderr.write(f"\r   {done}/{len(json_files)} reports processed")
+        if json_files and self.verbose:
+            sys.stderr.write("\n")
+        
+        return results
     
     def generate_legislative_summary(
         self, 
@@ -461,16 +1085,16 @@ For full analysis, visit: https://sparrowspot.example/
         grade = report.get('composite_grade', 'F')
         
         # Build context with legislative-appropriate framing
-        scores_text = "\n".join([
+        scores_text = "\n".join(
             f"- {name}: {data.get('score', 'N/A')}/100"
             for name, data in criteria.items()
-        ])
+        )
         
         # v8.3.3: Include AI Transparency dimension if available
         ai_transparency_text = ""
-        deep_analysis = report.get('deep_analysis', {})
+        deep_analysis = report.get('deep_analysis') or {}
         if deep_analysis:
-            consensus = deep_analysis.get('consensus', {})
+            consensus = deep_analysis.get('consensus') or {}
             ai_percentage = consensus.get('ai_percentage', 0)
             primary_model = consensus.get('primary_model', 'Unknown')
             if ai_percentage > 0:
@@ -481,96 +1105,13 @@ AI Content Analysis:
 - Likely AI Model: {primary_model}
 Note: AI detection in legislation may reflect drafting assistance rather than substantive issues."""
         
-        prompt = f"""You are a legislative analyst writing for the general public (reading level: Grade 10).
-
-Document: {document_title}
-Document Type: LEGISLATION (Bill/Act)
-Assessment Grade: {grade} | Score: {composite}/100
-
-Analysis Scores:
-{scores_text}
-{ai_transparency_text}
-
-IMPORTANT CONTEXT: This is a LEGISLATIVE document (a Bill or Act). Unlike policy proposals:
-- Legislation CREATES legal framework - it defines what IS law, not what SHOULD be
-- Legislation does not need external citations - it IS the primary source
-- Economic projections in legislation are authoritative statutory figures, not proposals
-- The goal is legal clarity, not policy advocacy
-
-Write a 400-500 word analysis that:
-1. Explains the legislative assessment grade in accessible terms
-2. Evaluates the LEGAL CLARITY of the bill (is the language unambiguous?)
-3. Assesses the REGULATORY SCOPE (what powers does it grant or restrict?)
-4. Reviews IMPLEMENTATION PROVISIONS (are enforcement mechanisms clear?)
-5. Notes any TRANSPARENCY concerns about how the legislation was drafted
-6. Explains what this means for citizens affected by this law
-
-DO NOT:
-- Suggest the legislation needs "revision" or "improvement" (it's enacted law)
-- Critique it as if it were a policy proposal
-- Recommend "stakeholder consultation" (legislative process already occurred)
-- Use phrases like "before implementation" (legislation IS implementation)
-
-Start with: "This legislative analysis of {document_title} received a grade of {grade}..."
-Focus on helping citizens understand the law's structure and implications."""
-
-        print("📝 Generating legislative analysis summary (Ollama)...")
-        print(f"   Model: {self.model}")
-        print(f"   Document: {document_title}")
-        print(f"   Type: LEGISLATION")
-        
-        summary = self._call_ollama(prompt, purpose="legislative_summary")
-        
-        if not summary:
-            print("⚠️  Primary model failed, trying fallback...")
-            summary = self._call_ollama(prompt, self.fallback_model, purpose="legislative_summary_fallback")
-        
-        if not summary:
-            print("❌ Summary generation failed")
-            return None
-        
-        # Add metadata with legislative-specific framing
-        full_summary = f"""LEGISLATIVE ANALYSIS SUMMARY
-{'=' * 70}
-
-Title: {document_title}
-Document Type: Legislation (Bill/Act)
-Assessment Grade: {grade} ({composite}/100)
-Generated: {datetime.now().strftime('%B %d, %Y')}
-Reading Level: Grade 10+ (Civic Literacy)
-
-{'=' * 70}
-
-{summary.strip()}
-
-{'=' * 70}
-
-About This Analysis:
-This analysis was generated to help citizens understand legislative documents.
-Legislation is a PRIMARY SOURCE - it creates law rather than proposing policy.
-
-Assessment Criteria for Legislation:
-- FT (Fiscal Transparency): How clearly are budgetary provisions disclosed?
-- SB (Stakeholder Balance): Does the legislation consider diverse affected parties?
-- ER (Economic Rigor): Are economic provisions well-defined and calculable?
-- PA (Public Accessibility): How readable is the legislative language?
-- PC (Policy Consequentiality): What real-world changes does this law create?
-- AT (AI Transparency): Was AI assistance used in drafting or analysis?
-
-Note: Legislative documents are self-authorizing and do not require external
-citations in the same way policy proposals do.
-
-For full technical analysis, see the complete assessment report.
-"""
-        
-        # Save to file if specified
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_summary)
-            print(f"   ✓ Saved: {output_file}")
-            return output_file
-        
-        return full_summary
+        return self._render_summary(_LEGISLATIVE_SUMMARY, {
+            "document_title": document_title,
+            "grade": grade,
+            "composite": composite,
+            "scores_text": scores_text,
+            "ai_transparency_text": ai_transparency_text,
+        }, output_file)
     
     def generate_budget_summary(
         self, 
@@ -587,97 +1128,141 @@ For full technical analysis, see the complete assessment report.
         composite = report.get('composite_score', 0)
         grade = report.get('composite_grade', 'F')
         
-        scores_text = "\n".join([
+        scores_text = "\n".join(
             f"- {name}: {data.get('score', 'N/A')}/100"
             for name, data in criteria.items()
-        ])
+        )
         
         # AI transparency
         ai_transparency_text = ""
-        deep_analysis = report.get('deep_analysis', {})
+        deep_analysis = report.get('deep_analysis') or {}
         if deep_analysis:
-            consensus = deep_analysis.get('consensus', {})
+            consensus = deep_analysis.get('consensus') or {}
             ai_percentage = consensus.get('ai_percentage', 0)
             if ai_percentage > 0:
                 ai_transparency_text = f"\n- AI-Assisted Content Detected: {ai_percentage:.1f}%"
         
-        prompt = f"""You are a fiscal analyst writing for taxpayers (reading level: Grade 9).
-
-Document: {document_title}
-Document Type: GOVERNMENT BUDGET
-Assessment Grade: {grade} | Score: {composite}/100
-
-Analysis Scores:
-{scores_text}
-{ai_transparency_text}
-
-IMPORTANT CONTEXT: This is a BUDGET document - an official allocation of public funds.
-- Budget figures are authoritative - they represent actual spending commitments
-- Fiscal Transparency is especially important (how clearly is spending itemized?)
-- Economic Rigor matters (are projections realistic and well-supported?)
-
-Write a 400-500 word analysis that:
-1. Explains the budget assessment grade in plain language
-2. Highlights how clearly spending is itemized and explained
-3. Assesses whether revenue projections appear realistic
-4. Notes any transparency gaps in how funds are allocated
-5. Explains what this means for taxpayers
-
-Start with: "This budget analysis of {document_title} received a grade of {grade}..."
-Focus on fiscal accountability and taxpayer understanding."""
-
-        print("📝 Generating budget analysis summary (Ollama)...")
-        print(f"   Model: {self.model}")
-        print(f"   Document: {document_title}")
-        print(f"   Type: BUDGET")
+        return self._render_summary(_BUDGET_SUMMARY, {
+            "document_title": document_title,
+            "grade": grade,
+            "composite": composite,
+            "scores_text": scores_text,
+            "ai_transparency_text": ai_transparency_text,
+        }, output_file)
+    
+    def generate_summaries_batch(
+        self,
+        reports: List[Tuple[Dict[str, Any], str]],
+        variant: str = 'policy',
+        max_workers: int = 4
+    ) -> List[Optional[str]]:
+        """Generate summaries for several reports concurrently.
         
-        summary = self._call_ollama(prompt, purpose="budget_summary")
+        Ollama does the work server-side, so a small thread pool overlaps the
+        HTTP waits over the shared session (keep max_workers <= its pool size).
         
-        if not summary:
-            summary = self._call_ollama(prompt, self.fallback_model, purpose="budget_summary_fallback")
+        Args:
+            reports: (report, document_title) pairs
+            variant: 'policy', 'journalism', 'legislative' or 'budget'
+            max_workers: Concurrent requests to Ollama
         
-        if not summary:
-            return None
+        Returns:
+            Summaries in input order (None where generation failed)
+        """
+        generate = self._summary_generator(variant)
         
-        full_summary = f"""BUDGET ANALYSIS SUMMARY
-{'=' * 70}
-
-Title: {document_title}
-Document Type: Government Budget
-Assessment Grade: {grade} ({composite}/100)
-Generated: {datetime.now().strftime('%B %d, %Y')}
-Reading Level: Grade 9+ (Taxpayer Literacy)
-
-{'=' * 70}
-
-{summary.strip()}
-
-{'=' * 70}
-
-Budget Assessment Criteria:
-- FT (Fiscal Transparency): How clearly is spending itemized?
-- SB (Stakeholder Balance): Are different sectors fairly represented?
-- ER (Economic Rigor): Are revenue/spending projections realistic?
-- PA (Public Accessibility): Can taxpayers understand the allocations?
-- PC (Policy Consequentiality): What real-world impact will spending have?
-
-For full technical analysis, see the complete assessment report.
-"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: generate(*item), reports))
+    
+    async def generate_summaries_async(
+        self,
+        reports: List[Tuple[Dict[str, Any], str]],
+        variant: str = 'policy',
+        max_concurrency: int = 4
+    ) -> List[Optional[str]]:
+        """Async counterpart of generate_summaries_batch for event-loop callers.
         
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(full_summary)
-            print(f"   ✓ Saved: {output_file}")
-            return output_file
+        Each summary runs in a worker thread via asyncio.to_thread, so the
+        pooled session, caching and provenance logging are shared with the
+        sync path; a semaphore caps in-flight requests at max_concurrency.
         
-        return full_summary
+        Returns:
+            Summaries in input order (None where generation failed)
+        """
+        # Imported here: asyncio is the costliest import in this module, and
+        # an event-loop caller has already loaded it
+        import asyncio
+        
+        generate = self._summary_generator(variant)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(report: Dict[str, Any], title: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(generate, report, title)
+        
+        return list(await asyncio.gather(*(run(report, title) for report, title in reports)))
+    
+    def generate_all_variants(
+        self,
+        report: Dict[str, Any],
+        document_title: str = "",
+        output_dir: Optional[str] = None,
+        variants: Tuple[str, ...] = ('policy', 'journalism', 'legislative')
+    ) -> Dict[str, Optional[str]]:
+        """Generate several summary variants of one report concurrently.
+        
+        The variants are independent requests, so with OLLAMA_NUM_PARALLEL >=
+        len(variants) Ollama batches them together; a server with a single
+        slot simply queues them.
+        
+        Args:
+            report: Analysis report dictionary
+            document_title: Title used in every variant
+            output_dir: Optional directory for <variant>_summary.txt files
+            variants: Variant names accepted by generate_summaries_batch
+        
+        Returns:
+            Variant name -> summary (or output path when saved; None on failure)
+        """
+        def run(variant: str) -> Optional[str]:
+            output_file = None
+            if output_dir:
+                output_file = os.path.join(output_dir, f"{variant}_summary.txt")
+            return self._summary_generator(variant)(report, document_title, output_file)
+        
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=len(variants) or 1) as executor:
+            return dict(zip(variants, executor.map(run, variants)))
+    
+    def _summary_generator(self, variant: str):
+        """Return the generate_*_summary method for a batch variant name."""
+        return {
+            'policy': self.generate_policy_summary,
+            'journalism': self.generate_journalism_summary,
+            'legislative': self.generate_legislative_summary,
+            'budget': self.generate_budget_summary,
+        }[variant]
     
     def test_connection(self) -> bool:
-        """Test Ollama connection."""
+        """Test Ollama connection and preload the model (success is remembered for 30 seconds)."""
+        checked_at = self._conn_cache.get(self.ollama_url)
+        if checked_at is not None and time.monotonic() - checked_at < self._CONN_CACHE_TTL:
+            self.warm_up()
+            return True
+        
+        requests = _get_requests()
         try:
+            # Plain request, not the retrying session: with Ollama down this
+            # must fail at once rather than after the retry backoff
             response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
             if response.status_code == 200:
-                print(f"✓ Ollama connected at {self.ollama_url}")
+                self._conn_cache[self.ollama_url] = time.monotonic()
+                # Models may have been pulled since they were found missing
+                with self._lock:
+                    self._missing_models.clear()
+                self._info(f"✓ Ollama connected at {self.ollama_url}")
+                self.warm_up()
                 return True
         except requests.exceptions.RequestException:
             pass
@@ -687,10 +1272,9 @@ For full technical analysis, see the complete assessment report.
 
 
 if __name__ == '__main__':
-    import sys
-    
     # Test usage
     gen = OllamaSummaryGenerator()
+    gen.on_token = lambda text: print(text, end="", flush=True)
     
     if not gen.test_connection():
         sys.exit(1)
@@ -700,7 +1284,12 @@ if __name__ == '__main__':
         json_file = sys.argv[1]
         variant = sys.argv[2] if len(sys.argv) > 2 else 'policy'
         
-        print(f"\n📖 Generating {variant} summary from {json_file}...")
-        gen.generate_quick_summary(json_file, variant)
+        if os.path.isdir(json_file):
+            print(f"\n📖 Generating {variant} summaries for reports in {json_file}...")
+            gen.on_token = None  # Concurrent streams would interleave
+            gen.generate_batch(json_file, variant)
+        else:
+            print(f"\n📖 Generating {variant} summary from {json_file}...")
+            gen.generate_quick_summary(json_file, variant)
     else:
-        print("Usage: python ollama_summary_generator.py <report.json> [policy|journalism]")
+        print("Usage: python ollama_summary_generator.py <report.json|report_dir> [policy|journalism]")
@@ -4,9 +4,17 @@ Level 5: AI Phrase Fingerprinting
 Comprehensive database of model-specific phrase signatures
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
+from bisect import bisect_right
 from collections import Counter
+from functools import lru_cache
+
+_WORD_CHAR = re.compile(r'\w')
+
+# Characters re.IGNORECASE matches to an ASCII letter that str.lower() doesn't
+# map to it ('İ' would also lower to two characters and shift positions)
+_CASE_FOLD = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
 
 class PhraseFingerprints:
     """
@@ -195,6 +203,65 @@ class PhraseFingerprints:
             'Gemini': self.GEMINI_PHRASES,
             'Mistral': self.MISTRAL_PHRASES,
         }
+        
+        # Compile every phrase once. Python's re has no multi-literal prefilter,
+        # so one big alternation is tried at every word boundary; searched one
+        # by one, a phrase that begins with a literal is found by re's fast
+        # substring search instead (the stdlib's closest thing to an
+        # Aho-Corasick automaton). That only works without the leading \b, so
+        # the word boundary before such a match is checked separately.
+        # The phrases are all lowercase and are matched case-sensitively
+        # against a lowercased copy of the text, so re doesn't case-fold every
+        # character it compares.
+        self._phrase_keys: List[Tuple[str, str]] = []  # phrase index -> (model, category)
+        self._compiled: Dict[str, List[Tuple[int, re.Pattern, bool]]] = {}
+        for model, categories in self.phrase_db.items():
+            compiled = self._compiled[model] = []
+            for category, patterns in categories.items():
+                for pattern in patterns:
+                    index = len(self._phrase_keys)
+                    self._phrase_keys.append((model, category))
+                    # '.*' phrases keep their \b: their literal part is too short to help
+                    literal = '.*' not in pattern and pattern.startswith(r'\b')
+                    if literal:
+                        pattern = pattern[2:]
+                    compiled.append((index, re.compile(pattern), literal))
+        
+        # Matches for recently scanned texts, so the same text scanned again
+        # (a re-run, or scan_text followed by get_phrase_count) isn't searched
+        # twice. The results are only read, never modified, by the callers.
+        self._cached_search = lru_cache(maxsize=32)(self._search_phrases)
+    
+    # Longer texts are searched every time rather than kept alive by the cache
+    MAX_CACHED_TEXT = 1_000_000
+    
+    def _find_matches(self, text: str, model: Optional[str] = None) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+        """
+        Find every phrase fingerprint (of one model, or all) in text.
+        
+        Returns:
+            (model, category) -> list of (start, end) spans, ordered by phrase
+            then position (the order of one re.finditer per phrase)
+        """
+        if len(text) > self.MAX_CACHED_TEXT:
+            return self._search_phrases(text, model)
+        return self._cached_search(text, model)
+    
+    def _search_phrases(self, text: str, model: Optional[str]) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+        """Uncached search behind _find_matches."""
+        # Same length as text, so spans index the original text
+        lowered = (text if text.isascii() else text.translate(_CASE_FOLD)).lower()
+        models = [model] if model else self._compiled
+        found = {}
+        for name in models:
+            for index, pattern, literal in self._compiled[name]:
+                for match in pattern.finditer(lowered):
+                    start = match.start()
+                    # Stands in for the \b stripped from literal phrases
+                    if literal and start and _WORD_CHAR.match(text, start - 1):
+                        continue
+                    found.setdefault(self._phrase_keys[index], []).append((start, match.end()))
+        return found
     
     def scan_text(self, text: str) -> Dict[str, any]:
         """
@@ -203,6 +270,35 @@ class PhraseFingerprints:
         Returns:
             Dictionary with model matches and specific phrases found
         """
+        return self._build_scan_results(text, self._find_matches(text))
+    
+    def scan_texts(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Scan several texts for phrase fingerprints at once.
+        
+        The texts are joined with newlines, which no phrase can span, and
+        searched together, so a batch of short texts doesn't pay for a full
+        set of pattern scans per text.
+        
+        Returns:
+            One scan_text result per text, in input order
+        """
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        
+        per_text = [{} for _ in texts]
+        for key, spans in self._find_matches('\n'.join(texts)).items():
+            for start, end in spans:
+                i = bisect_right(offsets, start) - 1
+                per_text[i].setdefault(key, []).append((start - offsets[i], end - offsets[i]))
+        
+        return [self._build_scan_results(text, found) for text, found in zip(texts, per_text)]
+    
+    def _build_scan_results(self, text: str, found: Dict[Tuple[str, str], List[Tuple[int, int]]]) -> Dict[str, any]:
+        """Assemble scan_text results from the phrase matches found in text."""
         results = {}
         total_matches = 0
         
@@ -210,20 +306,22 @@ class PhraseFingerprints:
             model_matches = {}
             model_total = 0
             
-            for category, patterns in categories.items():
-                matches = []
-                
-                for pattern in patterns:
-                    found = re.findall(pattern, text, re.IGNORECASE)
-                    if found:
-                        matches.extend(found)
+            for category in categories:
+                spans = found.get((model, category))
                 
-                if matches:
+                if spans:
+                    # First 5 unique examples, in a stable order; only the
+                    # spans are kept until then, not a string per match
+                    examples = {}
+                    for start, end in spans:
+                        examples.setdefault(text[start:end])
+                        if len(examples) == 5:
+                            break
                     model_matches[category] = {
-                        'count': len(matches),
-                        'examples': list(set(matches))[:5]  # Top 5 unique examples
+                        'count': len(spans),
+                        'examples': list(examples)
                     }
-                    model_total += len(matches)
+                    model_total += len(spans)
             
             if model_matches:
                 results[model] = {
@@ -282,30 +380,31 @@ class PhraseFingerprints:
             ctx_end = min(len(text), match_end + context_chars)
             return text[ctx_start:ctx_end].replace('\n', ' ').strip()
         
+        found = self._find_matches(text)
+        
         for model, categories in self.phrase_db.items():
             model_matches = {}
             model_total = 0
             model_detailed = []
             
-            for category, patterns in categories.items():
+            for category in categories:
                 category_detailed = []
                 
-                for pattern in patterns:
-                    for match in re.finditer(pattern, text, re.IGNORECASE):
-                        model_total += 1
-                        total_matches += 1
-                        
-                        match_info = {
-                            'model': model,
-                            'category': category,
-                            'phrase': match.group(),
-                            'line_number': get_line_number(match.start()),
-                            'char_position': match.start(),
-                            'context': get_context(match.start(), match.end())
-                        }
-                        category_detailed.append(match_info)
-                        model_detailed.append(match_info)
-                        all_detailed_matches.append(match_info)
+                for start, end in found.get((model, category), ()):
+                    model_total += 1
+                    total_matches += 1
+                    
+                    match_info = {
+                        'model': model,
+                        'category': category,
+                        'phrase': text[start:end],
+                        'line_number': get_line_number(start),
+                        'char_position': start,
+                        'context': get_context(start, end)
+                    }
+                    category_detailed.append(match_info)
+                    model_detailed.append(match_info)
+                    all_detailed_matches.append(match_info)
                 
                 if category_detailed:
                     # Get unique phrases with their first locations
@@ -376,13 +475,10 @@ class PhraseFingerprints:
             return {}
         
         results = {}
-        categories = self.phrase_db[model]
+        found = self._find_matches(text, model)
         
-        for category, patterns in categories.items():
-            count = 0
-            for pattern in patterns:
-                count += len(re.findall(pattern, text, re.IGNORECASE))
-            results[category] = count
+        for category in self.phrase_db[model]:
+            results[category] = len(found.get((model, category), ()))
         
         return results
     
@@ -391,7 +487,7 @@ class PhraseFingerprints:
         if scan_results.get('total_fingerprints_found', 0) == 0:
             return "No AI phrase fingerprints detected."
         
-        report = f"""
+        parts = [f"""
 {'='*80}
 LEVEL 5: AI PHRASE FINGERPRINTING ANALYSIS
 {'='*80}
@@ -403,24 +499,24 @@ Total Fingerprints: {scan_results['total_fingerprints_found']}
 {'-'*80}
 MODEL-SPECIFIC SIGNATURES:
 {'-'*80}
-"""
+"""]
         
         for model in ['Cohere', 'Claude', 'GPT', 'Gemini', 'Mistral']:
             if model in scan_results and model != 'primary_model':
                 model_data = scan_results[model]
-                report += f"\n{model}:\n"
-                report += f"  Total Matches: {model_data['total_matches']}\n"
-                report += f"  Confidence: {model_data['confidence']}%\n"
+                parts.append(f"\n{model}:\n")
+                parts.append(f"  Total Matches: {model_data['total_matches']}\n")
+                parts.append(f"  Confidence: {model_data['confidence']}%\n")
                 
                 if model_data['categories']:
-                    report += f"  Categories Found:\n"
+                    parts.append("  Categories Found:\n")
                     for category, data in model_data['categories'].items():
-                        report += f"    • {category}: {data['count']} instances\n"
+                        parts.append(f"    • {category}: {data['count']} instances\n")
                         if data['examples']:
-                            report += f"      Examples: {', '.join(data['examples'][:3])}\n"
+                            parts.append(f"      Examples: {', '.join(data['examples'][:3])}\n")
         
-        report += f"\n{'='*80}\n"
-        return report
+        parts.append(f"\n{'='*80}\n")
+        return "".join(parts)
 
 
 def main():
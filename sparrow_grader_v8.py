@@ -3374,7 +3374,7 @@ def main():
                     transparency_dir.mkdir(parents=True, exist_ok=True)
                     output_nist = str(transparency_dir / f"{output_name}_nist_compliance.txt")
                     with open(output_nist, 'w', encoding='utf-8') as f:
-                        f.write(checker.generate_compliance_report(compliance_results))
+                        checker.write_compliance_report(compliance_results, f)
                     print(f"   ✓ NIST Compliance: {output_nist}")
                     
                     # Add to main report